@@ -288,18 +288,26 @@ test\:stress\:disk: $(if $(SETUP_DONE),,runtime\:debug)
 		$(CARGOTEST_FILTER); \
 	fi
 
-# Python SDK unit tests.
+# Python SDK unit tests. Spread across workers (one file per worker).
 test\:unit\:python: _ensure-python-deps
 	@echo "🧪 Running Python SDK unit tests..."
-	@. .venv/bin/activate && cd sdks/python && python -m pytest tests/ -v -m "not integration" $(PYTEST_FILTER)
+	@. .venv/bin/activate && cd sdks/python && python -m pytest tests/ -v -m "not integration" -n auto --dist=loadfile $(PYTEST_FILTER)
+
+# Python SDK integration tests. Tests are spread one by one across xdist
+# workers, each with its own runtime home under BOXLITE_HOME (see
+# tests/conftest.py); modules sharing a box fixture pin themselves to one
+# worker with xdist_group (test_simplebox, test_sync_api, test_sync_codebox,
+# test_sync_simplebox), and any new module with a module-scoped box must do
+# the same. Two cores are left for the VMs' host-side work; override with
+# PYTEST_WORKERS=N.
+PYTEST_WORKERS ?= $(shell n=$$(( $$(getconf _NPROCESSORS_ONLN) - 2 )); [ $$n -ge 1 ] && echo $$n || echo 1)
 
-# Python SDK integration tests.
 test\:integration\:python:
 	@$(MAKE) dev:python
 	@echo "🧪 Running Python SDK integration tests..."
 	@BOXLITE_HOME=$$(mktemp -d /tmp/boxlite-test-python-XXXXXX) && \
 	 trap "rm -rf $$BOXLITE_HOME" EXIT && \
-	 . .venv/bin/activate && cd sdks/python && BOXLITE_HOME=$$BOXLITE_HOME python -m pytest tests/ -v -m "integration" $(PYTEST_FILTER)
+	 . .venv/bin/activate && cd sdks/python && BOXLITE_HOME=$$BOXLITE_HOME python -m pytest tests/ -v -m "integration" -n $(PYTEST_WORKERS) --dist=loadgroup $(PYTEST_FILTER)
 
 # Python SDK full suite.
 test\:all\:python:
@@ -14,8 +14,15 @@ if TYPE_CHECKING:
 
 
 def _read_text_file(path: str) -> str:
-    with open(path) as f:
-        return f.read()
+    """Read a UTF-8 script from the host, dropping a leading BOM if present.
+
+    Read as bytes and decoded once: exec arguments cross into the native layer
+    as str, so the text is needed anyway, but this skips the text-mode
+    newline translation layer and doesn't depend on the locale encoding.
+    UTF-8 is also what Python assumes for source files (PEP 3120).
+    """
+    with open(path, "rb") as f:
+        return f.read().decode("utf-8-sig")
 
 
 class CodeBox(SimpleBox):
@@ -74,6 +81,10 @@ class CodeBox(SimpleBox):
             Uses python3 from the container images.
             For custom Python paths, use exec() directly:
                 result = await cb.exec("/path/to/python", "-c", code)
+
+            Each call starts its own interpreter process, so no state is
+            shared between calls and independent calls may run concurrently:
+                first, second = await asyncio.gather(cb.run(a), cb.run(b))
         """
         # Execute Python code using python3 -c
         result = await self.exec("/usr/local/bin/python", "-c", code)
@@ -84,10 +95,15 @@ class CodeBox(SimpleBox):
         Execute a Python script file in the container.
 
         Args:
-            script_path: Path to the Python script on the host
+            script_path: Path to the Python script on the host. The file must
+                be UTF-8 encoded (a leading BOM is allowed), whatever the
+                host locale.
 
         Returns:
             Execution stdout as a string
+
+        Raises:
+            UnicodeDecodeError: If the file is not valid UTF-8
         """
         code = await asyncio.to_thread(_read_text_file, script_path)
         return await self.run(code)
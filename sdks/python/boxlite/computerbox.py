@@ -7,10 +7,15 @@ that can be viewed from a browser, with full GUI automation support.
 
 import asyncio
 import logging
+import re
+import secrets
+import shlex
+import time
 from typing import TYPE_CHECKING, Optional
 
 from . import constants as const
 from .errors import ExecError, ParseError, TimeoutError
+from .exec import ExecResult
 from .simplebox import SimpleBox
 
 if TYPE_CHECKING:
@@ -20,6 +25,171 @@ __all__ = ["ComputerBox"]
 
 logger = logging.getLogger("boxlite.computerbox")
 
+# `xdotool getmouselocation --shell` prints "X=..\nY=..\nSCREEN=..\nWINDOW=.."
+_CURSOR_XY_RE = re.compile(r"X=(\d+)\s+Y=(\d+)")
+
+# Fixed command lines, built once rather than on every call
+_PGREP_DESKTOP = ("pgrep", "-x", "xfdesktop")
+_LIST_WINDOWS = ("xwininfo", "-tree", "-root")
+_LEFT_CLICK = ("xdotool", "click", "1")
+_RIGHT_CLICK = ("xdotool", "click", "3")
+_MIDDLE_CLICK = ("xdotool", "click", "2")
+_DOUBLE_CLICK = ("xdotool", "click", "--repeat", "2", "--delay", "100", "1")
+_TRIPLE_CLICK = ("xdotool", "click", "--repeat", "3", "--delay", "100", "1")
+_GET_MOUSE_LOCATION = ("xdotool", "getmouselocation", "--shell")
+_GET_DISPLAY_GEOMETRY = ("xdotool", "getdisplaygeometry")
+# xdotool mouse buttons for each scroll direction
+_SCROLL_DIR = {"up": "4", "down": "5", "left": "6", "right": "7"}
+
+# Capturing an explicit bbox skips PIL's own root-window geometry query.
+# The PNG is encoded in the guest with pybase64 (SIMD) when the image has it,
+# and written as bytes to skip the str round-trip through print().
+_SCREENSHOT_SCRIPT = """
+from PIL import ImageGrab
+import io
+import sys
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+img = ImageGrab.grab(bbox=(0, 0, {width}, {height}))
+buffer = io.BytesIO()
+img.save(buffer, format="PNG")
+sys.stdout.buffer.write(base64.b64encode(buffer.getbuffer()) + b"\\n")
+"""
+
+
+def _effective_display_size(env, width: int, height: int) -> tuple[int, int]:
+    """Display size the guest will use: the last DISPLAY_SIZEW/H in ``env``."""
+    for key, value in env:
+        if key not in ("DISPLAY_SIZEW", "DISPLAY_SIZEH"):
+            continue
+        try:
+            size = int(value)
+        except ValueError:
+            raise ValueError(f"{key} must be an integer, got {value!r}") from None
+        if key == "DISPLAY_SIZEW":
+            width = size
+        else:
+            height = size
+    return width, height
+
+
+class _FramedStream:
+    """One output stream of a ``_ShellSession``, split into per-command frames."""
+
+    def __init__(self, stream, terminator: str) -> None:
+        self._stream = stream
+        self._terminator = terminator
+        self._buffer = ""
+
+    async def read_frame(self) -> tuple[str, int]:
+        """Read up to the next terminator; return the output and exit status."""
+        terminator = self._terminator
+        buffer = self._buffer
+        search_from = 0
+        while True:
+            end = buffer.find(terminator, search_from)
+            if end == -1:
+                # Only rescan the tail that could hold a split marker
+                search_from = max(0, len(buffer) - len(terminator))
+            else:
+                search_from = end
+                eol = buffer.find("\n", end + len(terminator))
+                if eol != -1:
+                    break
+            try:
+                chunk = await self._stream.__anext__()
+            except StopAsyncIteration:
+                self._buffer = buffer
+                raise ConnectionError("ComputerBox shell session closed")
+            if isinstance(chunk, bytes):
+                chunk = chunk.decode("utf-8", errors="replace")
+            buffer += chunk
+
+        self._buffer = buffer[eol + 1 :]
+        return buffer[:end], int(buffer[end + len(terminator) : eol])
+
+
+class _ShellSession:
+    """
+    Long-lived ``sh`` process inside the box that runs one command per request.
+
+    Each command is written to the shell's stdin followed by a ``printf`` of a
+    per-session marker and the command's exit status on both stdout and
+    stderr, so each stream's output can be framed separately without starting
+    a new guest process per call.
+
+    Commands read stdin from ``/dev/null``, so one that reads its input
+    can't swallow the commands queued after it.
+
+    A command that fails or doesn't finish within its timeout leaves the
+    streams mid-frame, so the session kills itself and is marked broken; the
+    owner opens a new one.
+    """
+
+    def __init__(self, execution) -> None:
+        self._execution = execution
+        self._stdin = execution.stdin()
+        self._terminator = f"\n__boxlite_done_{secrets.token_hex(8)}__ "
+        self._stdout = _FramedStream(execution.stdout(), self._terminator)
+        self._stderr = _FramedStream(execution.stderr(), self._terminator)
+        self._lock = asyncio.Lock()
+        self._broken = False
+
+    async def run(self, argv: tuple[str, ...], timeout: float) -> ExecResult:
+        """Run ``argv`` in the session and wait for its framed result.
+
+        Raises:
+            TimeoutError: If the command hasn't finished within ``timeout``
+                seconds.
+            ConnectionError: If the shell has exited.
+
+        On any error the session is killed and can't be used again.
+        """
+        marker = self._terminator[1:]
+        frame = f"printf '\\n{marker}%d\\n' $__boxlite_rc"
+        script = (
+            f"{shlex.join(argv)} </dev/null; __boxlite_rc=$?; {frame}; {frame} >&2\n"
+        )
+        async with self._lock:
+            if self._broken:
+                raise ConnectionError("ComputerBox shell session closed")
+            try:
+                await self._stdin.send_input(script.encode("utf-8"))
+                # Both streams are drained together so neither pipe can fill
+                # up and stall the command while the other is being read.
+                (stdout, exit_code), (stderr, _) = await asyncio.wait_for(
+                    asyncio.gather(
+                        self._stdout.read_frame(), self._stderr.read_frame()
+                    ),
+                    timeout,
+                )
+            except asyncio.TimeoutError:
+                await self.kill()
+                raise TimeoutError(
+                    f"{shlex.join(argv)!r} did not finish within {timeout} seconds"
+                ) from None
+            except BaseException:
+                # Part of a frame may already be consumed; nothing after it
+                # can be trusted.
+                await self.kill()
+                raise
+
+        return ExecResult(exit_code=exit_code, stdout=stdout, stderr=stderr)
+
+    async def kill(self) -> None:
+        """Kill the shell and mark the session unusable."""
+        self._broken = True
+        try:
+            await self._execution.kill()
+        except Exception as e:  # noqa: BLE001 - the shell may already be gone
+            logger.debug(f"Error killing command session: {e}")
+
+    async def close(self) -> None:
+        """Close stdin so the shell exits."""
+        await self._stdin.close()
+
 
 class ComputerBox(SimpleBox):
     """
@@ -49,6 +219,9 @@ class ComputerBox(SimpleBox):
         gui_http_port: int = const.COMPUTERBOX_GUI_HTTP_PORT,
         gui_https_port: int = const.COMPUTERBOX_GUI_HTTPS_PORT,
         runtime: Optional["Boxlite"] = None,
+        display_width: int = const.COMPUTERBOX_DISPLAY_WIDTH,
+        display_height: int = const.COMPUTERBOX_DISPLAY_HEIGHT,
+        command_timeout: float = const.COMPUTERBOX_COMMAND_TIMEOUT,
         **kwargs,
     ):
         """
@@ -60,34 +233,88 @@ class ComputerBox(SimpleBox):
             gui_http_port: Port for HTTP desktop GUI (default: 3000)
             gui_https_port: Port for HTTPS desktop GUI (default: 3001)
             runtime: Optional runtime instance (uses global default if None)
+            display_width: Desktop width in pixels (default: 1024)
+            display_height: Desktop height in pixels (default: 768)
+            command_timeout: Seconds a single GUI command may take before the
+                box's command session is torn down (default: 30)
             **kwargs: Additional configuration options (volumes, etc.)
         """
-        user_env = kwargs.pop("env", [])
-        default_env = [
+        env = [
             ("DISPLAY", const.COMPUTERBOX_DISPLAY_NUMBER),
-            ("DISPLAY_SIZEW", str(const.COMPUTERBOX_DISPLAY_WIDTH)),
-            ("DISPLAY_SIZEH", str(const.COMPUTERBOX_DISPLAY_HEIGHT)),
-            ("SELKIES_MANUAL_WIDTH", str(const.COMPUTERBOX_DISPLAY_WIDTH)),
-            ("SELKIES_MANUAL_HEIGHT", str(const.COMPUTERBOX_DISPLAY_HEIGHT)),
+            ("DISPLAY_SIZEW", str(display_width)),
+            ("DISPLAY_SIZEH", str(display_height)),
+            ("SELKIES_MANUAL_WIDTH", str(display_width)),
+            ("SELKIES_MANUAL_HEIGHT", str(display_height)),
             ("SELKIES_UI_SHOW_SIDEBAR", "false"),
         ]
+        env.extend(kwargs.pop("env", ()))
+        # User env comes last and wins, so a DISPLAY_SIZEW/H passed there is
+        # the real display size; the bbox and size checks must follow it.
+        width, height = _effective_display_size(env, display_width, display_height)
 
-        user_ports = kwargs.pop("ports", [])
-        default_ports = [
+        ports = [
             (gui_http_port, const.COMPUTERBOX_GUI_HTTP_PORT),
             (gui_https_port, const.COMPUTERBOX_GUI_HTTPS_PORT),
         ]
+        ports.extend(kwargs.pop("ports", ()))
 
         super().__init__(
             image=const.COMPUTERBOX_IMAGE,
             memory_mib=memory,
             cpus=cpu,
             runtime=runtime,
-            env=default_env + list(user_env),
-            ports=default_ports + list(user_ports),
+            env=env,
+            ports=ports,
             **kwargs,
         )
 
+        # The geometry is fixed for the life of the box, so the capture script
+        # is specialised once instead of being rebuilt on every screenshot().
+        self._screenshot_src = _SCREENSHOT_SCRIPT.format(width=width, height=height)
+        self._width = width
+        self._height = height
+        self._command_timeout = command_timeout
+        self._session: _ShellSession | None = None
+        self._session_lock = asyncio.Lock()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the command session, then stop the box."""
+        if self._session is not None:
+            try:
+                await self._session.close()
+            except Exception as e:  # noqa: BLE001 - box is shutting down regardless
+                logger.debug(f"Error closing command session: {e}")
+            self._session = None
+        return await super().__aexit__(exc_type, exc_val, exc_tb)
+
+    async def _run(self, *argv: str) -> ExecResult:
+        """
+        Run a command through the box's persistent shell session.
+
+        The session is started on first use and reused for every subsequent
+        command, so GUI automation calls don't spawn a guest exec each time.
+        If the session breaks or a command times out, it is killed and
+        reopened on the next call, so one hung command can't block the rest.
+        """
+        if not self._started:
+            raise RuntimeError(
+                "Box not started. Use 'async with ComputerBox(...) as box:' "
+                "or call 'await box.start()' first."
+            )
+
+        async with self._session_lock:
+            if self._session is None:
+                execution = await self._box.exec("sh", args=[])
+                self._session = _ShellSession(execution)
+            session = self._session
+
+        try:
+            return await session.run(argv, self._command_timeout)
+        finally:
+            # run() has already killed a session it gave up on
+            if session._broken and self._session is session:
+                self._session = None
+
     async def wait_until_ready(self, timeout: int = const.DESKTOP_READY_TIMEOUT):
         """
         Wait until the desktop environment is fully loaded and ready.
@@ -99,20 +326,32 @@ class ComputerBox(SimpleBox):
             TimeoutError: If desktop doesn't become ready within timeout period
         """
         logger.info("Waiting for desktop to become ready...")
-        import time
-
-        start_time = time.time()
+        expected_size = f"{self._width}x{self._height}"
+        start_time = time.monotonic()
 
         while True:
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             if elapsed > timeout:
                 raise TimeoutError(
                     f"Desktop did not become ready within {timeout} seconds"
                 )
 
             try:
-                exec_result = await self.exec("xwininfo", "-tree", "-root")
-                expected_size = f"{const.COMPUTERBOX_DISPLAY_WIDTH}x{const.COMPUTERBOX_DISPLAY_HEIGHT}"
+                # Cheap probe first: the full window tree is only worth
+                # fetching once the desktop process is up. pgrep exits 1 when
+                # nothing matches; any other failure (e.g. pgrep missing)
+                # falls through to the full check.
+                probe = await self._run(*_PGREP_DESKTOP)
+                if probe.exit_code == 1:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            f"xfdesktop not running yet (waited {elapsed:.1f}s), "
+                            "retrying..."
+                        )
+                    await asyncio.sleep(const.DESKTOP_READY_RETRY_DELAY)
+                    continue
+
+                exec_result = await self._run(*_LIST_WINDOWS)
 
                 if (
                     "xfdesktop" in exec_result.stdout
@@ -121,13 +360,21 @@ class ComputerBox(SimpleBox):
                     logger.info(f"Desktop ready after {elapsed:.1f} seconds")
                     return
 
-                logger.debug(
-                    f"Desktop not ready yet (waited {elapsed:.1f}s), retrying..."
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"Desktop not ready yet (waited {elapsed:.1f}s), retrying..."
+                    )
                 await asyncio.sleep(const.DESKTOP_READY_RETRY_DELAY)
 
-            except (ExecError, ConnectionError, OSError, asyncio.TimeoutError) as e:
-                logger.debug(f"Desktop not ready: {e}, retrying...")
+            except (
+                ExecError,
+                TimeoutError,
+                ConnectionError,
+                OSError,
+                asyncio.TimeoutError,
+            ) as e:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Desktop not ready: {e}, retrying...")
                 await asyncio.sleep(const.DESKTOP_READY_RETRY_DELAY)
             except Exception as e:
                 logger.error(f"Fatal error in wait_until_ready: {e}")
@@ -142,30 +389,21 @@ class ComputerBox(SimpleBox):
         """
         logger.info("Taking screenshot...")
 
-        python_code = """
-from PIL import ImageGrab
-import io
-import base64
-img = ImageGrab.grab()
-buffer = io.BytesIO()
-img.save(buffer, format="PNG")
-print(base64.b64encode(buffer.getvalue()).decode("utf-8"))
-"""
-        exec_result = await self.exec("python3", "-c", python_code)
+        exec_result = await self._run("python3", "-c", self._screenshot_src)
 
         if exec_result.exit_code != 0:
             raise ExecError("screenshot()", exec_result.exit_code, exec_result.stderr)
 
         return {
             "data": exec_result.stdout.strip(),
-            "width": const.COMPUTERBOX_DISPLAY_WIDTH,
-            "height": const.COMPUTERBOX_DISPLAY_HEIGHT,
+            "width": self._width,
+            "height": self._height,
             "format": "png",
         }
 
     async def mouse_move(self, x: int, y: int):
         """Move mouse cursor to absolute coordinates."""
-        exec_result = await self.exec("xdotool", "mousemove", str(x), str(y))
+        exec_result = await self._run("xdotool", "mousemove", str(x), str(y))
         if exec_result.exit_code != 0:
             raise ExecError(
                 f"mouse_move({x}, {y})", exec_result.exit_code, exec_result.stderr
@@ -173,41 +411,37 @@ print(base64.b64encode(buffer.getvalue()).decode("utf-8"))
 
     async def left_click(self):
         """Click left mouse button at current position."""
-        exec_result = await self.exec("xdotool", "click", "1")
+        exec_result = await self._run(*_LEFT_CLICK)
         if exec_result.exit_code != 0:
             raise ExecError("left_click()", exec_result.exit_code, exec_result.stderr)
 
     async def right_click(self):
         """Click right mouse button at current position."""
-        exec_result = await self.exec("xdotool", "click", "3")
+        exec_result = await self._run(*_RIGHT_CLICK)
         if exec_result.exit_code != 0:
             raise ExecError("right_click()", exec_result.exit_code, exec_result.stderr)
 
     async def middle_click(self):
         """Click middle mouse button at current position."""
-        exec_result = await self.exec("xdotool", "click", "2")
+        exec_result = await self._run(*_MIDDLE_CLICK)
         if exec_result.exit_code != 0:
             raise ExecError("middle_click()", exec_result.exit_code, exec_result.stderr)
 
     async def double_click(self):
         """Double-click left mouse button at current position."""
-        exec_result = await self.exec(
-            "xdotool", "click", "--repeat", "2", "--delay", "100", "1"
-        )
+        exec_result = await self._run(*_DOUBLE_CLICK)
         if exec_result.exit_code != 0:
             raise ExecError("double_click()", exec_result.exit_code, exec_result.stderr)
 
     async def triple_click(self):
         """Triple-click left mouse button at current position."""
-        exec_result = await self.exec(
-            "xdotool", "click", "--repeat", "3", "--delay", "100", "1"
-        )
+        exec_result = await self._run(*_TRIPLE_CLICK)
         if exec_result.exit_code != 0:
             raise ExecError("triple_click()", exec_result.exit_code, exec_result.stderr)
 
     async def left_click_drag(self, start_x: int, start_y: int, end_x: int, end_y: int):
         """Drag mouse from start position to end position with left button held."""
-        exec_result = await self.exec(
+        exec_result = await self._run(
             "xdotool",
             "mousemove",
             str(start_x),
@@ -231,33 +465,26 @@ print(base64.b64encode(buffer.getvalue()).decode("utf-8"))
 
     async def cursor_position(self) -> tuple[int, int]:
         """Get the current mouse cursor position. Returns (x, y) tuple."""
-        exec_result = await self.exec("xdotool", "getmouselocation", "--shell")
+        exec_result = await self._run(*_GET_MOUSE_LOCATION)
         if exec_result.exit_code != 0:
             raise ExecError(
                 "cursor_position()", exec_result.exit_code, exec_result.stderr
             )
 
-        x, y = None, None
-        for line in exec_result.stdout.split("\n"):
-            line = line.strip()
-            if line.startswith("X="):
-                x = int(line[2:])
-            elif line.startswith("Y="):
-                y = int(line[2:])
-
-        if x is not None and y is not None:
-            return (x, y)
-        raise ParseError("Failed to parse cursor position from xdotool output")
+        match = _CURSOR_XY_RE.search(exec_result.stdout)
+        if match is None:
+            raise ParseError("Failed to parse cursor position from xdotool output")
+        return (int(match.group(1)), int(match.group(2)))
 
     async def type(self, text: str):
         """Type text using the keyboard."""
-        exec_result = await self.exec("xdotool", "type", "--", text)
+        exec_result = await self._run("xdotool", "type", "--", text)
         if exec_result.exit_code != 0:
             raise ExecError("type()", exec_result.exit_code, exec_result.stderr)
 
     async def key(self, text: str):
         """Press a special key or key combination (e.g., 'Return', 'ctrl+c')."""
-        exec_result = await self.exec("xdotool", "key", text)
+        exec_result = await self._run("xdotool", "key", text)
         if exec_result.exit_code != 0:
             raise ExecError("key()", exec_result.exit_code, exec_result.stderr)
 
@@ -270,12 +497,11 @@ print(base64.b64encode(buffer.getvalue()).decode("utf-8"))
             direction: 'up', 'down', 'left', or 'right'
             amount: Number of scroll units (default: 3)
         """
-        direction_map = {"up": "4", "down": "5", "left": "6", "right": "7"}
-        button = direction_map.get(direction.lower())
+        button = _SCROLL_DIR.get(direction.lower())
         if not button:
             raise ValueError(f"Invalid scroll direction: {direction}")
 
-        exec_result = await self.exec(
+        exec_result = await self._run(
             "xdotool",
             "mousemove",
             str(x),
@@ -290,13 +516,15 @@ print(base64.b64encode(buffer.getvalue()).decode("utf-8"))
 
     async def get_screen_size(self) -> tuple[int, int]:
         """Get the screen resolution. Returns (width, height) tuple."""
-        exec_result = await self.exec("xdotool", "getdisplaygeometry")
+        exec_result = await self._run(*_GET_DISPLAY_GEOMETRY)
         if exec_result.exit_code != 0:
             raise ExecError(
                 "get_screen_size()", exec_result.exit_code, exec_result.stderr
             )
 
-        parts = exec_result.stdout.strip().split()
-        if len(parts) == 2:
-            return (int(parts[0]), int(parts[1]))
-        raise ParseError("Failed to parse screen size from xdotool output")
+        # Output is "<width> <height>\n"
+        width, _, height = exec_result.stdout.partition(" ")
+        try:
+            return (int(width), int(height))
+        except ValueError:
+            raise ParseError("Failed to parse screen size from xdotool output")
@@ -36,3 +36,6 @@ SKILLBOX_GUI_HTTPS_PORT = 3001
 # Timeouts (seconds)
 DESKTOP_READY_TIMEOUT = 60
 DESKTOP_READY_RETRY_DELAY = 0.5
+# One ComputerBox command (click, screenshot, ...); past this the shell
+# session is assumed hung and is torn down
+COMPUTERBOX_COMMAND_TIMEOUT = 30
@@ -11,7 +11,7 @@ __all__ = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecResult:
     """
     Result from a command execution.
@@ -28,3 +28,15 @@ class ExecResult:
     stdout: str
     stderr: str
     error_message: str | None = None
+
+
+def _join_output(chunks: list) -> str:
+    """Join collected output chunks into a single string.
+
+    Byte chunks are concatenated first and decoded once, so the decoder runs
+    over one contiguous buffer and multi-byte UTF-8 sequences split across
+    chunks are preserved.
+    """
+    if chunks and isinstance(chunks[0], bytes):
+        return b"".join(chunks).decode("utf-8", errors="replace")
+    return "".join(chunks)
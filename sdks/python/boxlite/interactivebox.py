@@ -20,6 +20,68 @@ if TYPE_CHECKING:
 # Configure logger
 logger = logging.getLogger("boxlite.interactivebox")
 
+# Upper bound on how long __aexit__ waits for the shell's remaining output
+# after closing its stdin; only a session still stuck after this is cancelled
+_IO_DRAIN_TIMEOUT = 5.0
+
+
+# Max PTY chunks buffered between a stream reader and its terminal writer
+_OUTPUT_QUEUE_SIZE = 64
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write ``data`` to ``fd`` unbuffered, retrying on short writes."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _writev_all(fd: int, chunks: list[bytes]) -> None:
+    """Write ``chunks`` to ``fd`` with one writev(2), finishing short writes."""
+    written = os.writev(fd, chunks)
+    if written < sum(map(len, chunks)):
+        _write_all(fd, b"".join(chunks)[written:])
+
+
+async def _pump(stream, fd: int) -> None:
+    """Copy ``stream`` to ``fd``, coalescing queued chunks into one writev(2).
+
+    A reader task keeps pulling from the stream while the terminal write is
+    in progress; everything that piles up meanwhile goes out in a single
+    syscall instead of one write per chunk.
+    """
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=_OUTPUT_QUEUE_SIZE)
+
+    async def read():
+        try:
+            async for chunk in stream:
+                if not isinstance(chunk, bytes):
+                    chunk = chunk.encode("utf-8", errors="replace")
+                await queue.put(chunk)
+        except Exception:
+            await queue.put(None)
+            raise
+        await queue.put(None)
+
+    reader = asyncio.ensure_future(read())
+    try:
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            # The reader stops after its sentinel, so it can only be last
+            eof = batch[-1] is None
+            if eof:
+                batch.pop()
+            if batch:
+                _writev_all(fd, batch)
+            if eof:
+                break
+        await reader  # surface stream errors
+    finally:
+        reader.cancel()
+
 
 class InteractiveBox(SimpleBox):
     """
@@ -134,7 +196,9 @@ class InteractiveBox(SimpleBox):
             )
         else:
             # No I/O forwarding, just wait for execution
-            self._io_task = self._wait_for_exit()
+            self._io_task = asyncio.gather(
+                self._wait_for_exit(), return_exceptions=True
+            )
 
         return self
 
@@ -149,18 +213,37 @@ class InteractiveBox(SimpleBox):
                 logger.error(f"Caught exception on TTY settings: {e}")
 
         """Exit interactive session and restore terminal."""
-        # Wait for I/O task to complete (or cancel if needed)
-        if hasattr(self, "_io_task") and self._io_task is not None:
+        # Signal shutdown up front so the forwarders stop on their own instead
+        # of being waited out: the exit event releases stdin forwarding, and
+        # closing the PTY's stdin lets the shell (and its output) wind down.
+        if self._exited is not None:
+            self._exited.set()
+        if self._stdin is not None:
             try:
-                # Give it a moment to finish naturally
-                await asyncio.wait_for(self._io_task, timeout=3)
+                await self._stdin.close()
+            except Exception as e:  # noqa: BLE001 - shell may already be gone
+                logger.debug(f"Error closing stdin: {e}")
+
+        if self._io_task is not None:
+            io_task = asyncio.ensure_future(self._io_task)
+            self._io_task = None
+            # Let the forwarders drain: the shell's last lines (and its exit)
+            # arrive after stdin is closed, and cutting them off loses output.
+            done, _ = await asyncio.wait({io_task}, timeout=_IO_DRAIN_TIMEOUT)
+            if done:
                 logger.info("Closing interactive shell (I/O tasks finished).")
-                self._io_task = None
-            except asyncio.TimeoutError:
-                # If it doesn't finish, that's ok - box is shutting down anyway
-                logger.error("Timeout waiting for I/O tasks to finish, cancelling...")
-            except Exception as e:  # noqa: BLE001 - exit path must not raise on cleanup failure
-                logger.error(f"Caught exception on exit: {e}")
+            else:
+                # Box is shutting down anyway; don't hold the user's exit.
+                logger.info(
+                    f"I/O tasks still running after {_IO_DRAIN_TIMEOUT}s, cancelling..."
+                )
+                io_task.cancel()
+                try:
+                    await io_task
+                except asyncio.CancelledError:
+                    pass
+                except Exception as e:  # noqa: BLE001 - exit path must not raise on cleanup failure
+                    logger.error(f"Caught exception on exit: {e}")
 
         # Print diagnostic after terminal is restored (clean output guaranteed)
         if self._error_message:
@@ -195,42 +278,34 @@ class InteractiveBox(SimpleBox):
 
             # Forward stdin in chunks
             loop = asyncio.get_event_loop()
-            while not self._exited.is_set():
-                # Read from stdin with timeout to check exit event
-                try:
-                    read_task = loop.run_in_executor(
-                        None, os.read, sys.stdin.fileno(), 1024
-                    )
+            stdin_fd = sys.stdin.fileno()
+            # One waiter for the exit event, shared by every read below
+            exit_wait = asyncio.ensure_future(self._exited.wait())
+            try:
+                while not self._exited.is_set():
+                    # Read from stdin in a worker thread (already a Future)
+                    read_task = loop.run_in_executor(None, os.read, stdin_fd, 1024)
                     # Wait for either stdin data or exit event
-                    done, pending = await asyncio.wait(
-                        [
-                            asyncio.ensure_future(read_task),
-                            asyncio.ensure_future(self._exited.wait()),
-                        ],
+                    await asyncio.wait(
+                        {read_task, exit_wait},
                         return_when=asyncio.FIRST_COMPLETED,
                     )
 
-                    # Cancel pending tasks
-                    for task in pending:
-                        task.cancel()
-
                     # Check if we exited
-                    if self._exited.is_set():
+                    if exit_wait.done():
+                        read_task.cancel()
                         logger.info("Closing interactive shell (stdin forwarding).")
                         break
 
-                    # Get the data from completed read task
-                    for task in done:
-                        if task.exception() is None:
-                            data = task.result()
-                            if isinstance(data, bytes) and data:
-                                await self._stdin.send_input(data)
-                            elif not data:
-                                # EOF
-                                return
-
-                except asyncio.CancelledError:
-                    break
+                    # Get the data from the completed read
+                    if read_task.exception() is None:
+                        data = read_task.result()
+                        if not data:
+                            # EOF
+                            return
+                        await self._stdin.send_input(data)
+            finally:
+                exit_wait.cancel()
 
         except asyncio.CancelledError:
             logger.info("Cancelling interactive shell (stdin forwarding).")
@@ -243,14 +318,10 @@ class InteractiveBox(SimpleBox):
             if self._stdout is None:
                 return
 
-            # Forward all output to stdout
-            async for chunk in self._stdout:
-                # Write directly to stdout (bypass print buffering)
-                if isinstance(chunk, bytes):
-                    sys.stdout.buffer.write(chunk)
-                else:
-                    sys.stdout.buffer.write(chunk.encode("utf-8", errors="replace"))
-                sys.stdout.buffer.flush()
+            # Forward all output straight to the stdout fd (bypasses the
+            # BufferedWriter copy and the extra flush syscall)
+            sys.stdout.flush()
+            await _pump(self._stdout, sys.stdout.fileno())
 
             logger.info("\nOutput forwarding ended.")
 
@@ -265,14 +336,9 @@ class InteractiveBox(SimpleBox):
             if self._stderr is None:
                 return
 
-            # Forward all error output to stderr
-            async for chunk in self._stderr:
-                # Write directly to stderr (bypass print buffering)
-                if isinstance(chunk, bytes):
-                    sys.stderr.buffer.write(chunk)
-                else:
-                    sys.stderr.buffer.write(chunk.encode("utf-8", errors="replace"))
-                sys.stderr.buffer.flush()
+            # Forward all error output straight to the stderr fd
+            sys.stderr.flush()
+            await _pump(self._stderr, sys.stderr.fileno())
 
             logger.info("\nStderr forwarding ended.")
 
@@ -6,24 +6,37 @@ Provides common functionality for all specialized boxes (CodeBox, BrowserBox, et
 
 import asyncio
 import logging
-from enum import IntEnum
-from typing import TYPE_CHECKING, Optional
+from typing import Optional
 
-from .exec import ExecResult
+from .exec import ExecResult, _join_output
 
-if TYPE_CHECKING:
-    from .boxlite import Boxlite
+try:
+    from .boxlite import Boxlite, BoxOptions
+except ImportError as e:  # native extension not built; reported on first use
+    Boxlite = BoxOptions = None
+    _native_import_error: ImportError | None = e
+else:
+    _native_import_error = None
 
 logger = logging.getLogger("boxlite.simplebox")
 
 __all__ = ["BoxTunnel", "NetworkHandle", "SimpleBox"]
 
 
-class StreamType(IntEnum):
-    """Stream type for command execution output."""
+_default_runtime_handle: Optional["Boxlite"] = None
 
-    STDOUT = 1
-    STDERR = 2
+
+def _default_runtime() -> "Boxlite":
+    """Return the shared default runtime handle, creating it on first use.
+
+    ``Boxlite.default()`` always wraps the same process-wide runtime, so boxes
+    created without an explicit runtime can share one handle instead of
+    redoing the native setup for every box.
+    """
+    global _default_runtime_handle
+    if _default_runtime_handle is None:
+        _default_runtime_handle = Boxlite.default()
+    return _default_runtime_handle
 
 
 class BoxTunnel:
@@ -106,17 +119,15 @@ class SimpleBox:
         if not image and not rootfs_path:
             raise ValueError("Either 'image' or 'rootfs_path' must be provided")
 
-        try:
-            from .boxlite import Boxlite, BoxOptions
-        except ImportError as e:
+        if _native_import_error is not None:
             raise ImportError(
-                f"BoxLite native extension not found: {e}. "
+                f"BoxLite native extension not found: {_native_import_error}. "
                 "Please install with: pip install boxlite"
             )
 
-        # Use provided runtime or get Rust's global default
+        # Use provided runtime or the shared handle to Rust's global default
         if runtime is None:
-            self._runtime = Boxlite.default()
+            self._runtime = _default_runtime()
         else:
             self._runtime = runtime
 
@@ -262,9 +273,9 @@ class SimpleBox:
                 "or call 'await box.start()' first."
             )
 
-        arg_list = list(args) if args else None
-        # Convert env dict to list of tuples if provided
-        env_list = list(env.items()) if env else None
+        arg_list = args or None
+        # The native binding takes the args tuple and env dict as they are
+        env_list = env or None
 
         # Execute via Rust (returns PyExecution)
         execution = await self._box.exec(
@@ -287,19 +298,16 @@ class SimpleBox:
         # Collect stdout and stderr concurrently to avoid deadlock.
         # Sequential reads can deadlock when a process fills one pipe buffer
         # while the SDK is blocked reading the other.
-        stdout_lines = []
-        stderr_lines = []
+        stdout_chunks = []
+        stderr_chunks = []
 
         async def collect_stdout():
             if not stdout:
                 return
             logger.debug("collecting stdout")
             try:
-                async for line in stdout:
-                    if isinstance(line, bytes):
-                        stdout_lines.append(line.decode("utf-8", errors="replace"))
-                    else:
-                        stdout_lines.append(line)
+                async for chunk in stdout:
+                    stdout_chunks.append(chunk)
             except Exception as e:  # noqa: BLE001 - stream collection must not crash exec(); partial output is acceptable
                 logger.error(f"collecting stdout err: {e}")
 
@@ -308,18 +316,15 @@ class SimpleBox:
                 return
             logger.debug("collecting stderr")
             try:
-                async for line in stderr:
-                    if isinstance(line, bytes):
-                        stderr_lines.append(line.decode("utf-8", errors="replace"))
-                    else:
-                        stderr_lines.append(line)
+                async for chunk in stderr:
+                    stderr_chunks.append(chunk)
             except Exception as e:  # noqa: BLE001 - stream collection must not crash exec(); partial output is acceptable
                 logger.error(f"collecting stderr err: {e}")
 
         await asyncio.gather(collect_stdout(), collect_stderr())
 
-        stdout = "".join(stdout_lines)
-        stderr = "".join(stderr_lines)
+        stdout = _join_output(stdout_chunks)
+        stderr = _join_output(stderr_chunks)
 
         error_message = None
         try:
@@ -330,7 +335,8 @@ class SimpleBox:
             logger.error(f"failed to wait execution: {e}")
             exit_code = -1
 
-        logger.debug(f"exec finish, exit_code: {exit_code}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"exec finish, exit_code: {exit_code}")
 
         return ExecResult(
             exit_code=exit_code,
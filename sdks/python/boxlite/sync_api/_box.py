@@ -6,11 +6,12 @@ Box metadata is intentionally available only through the async ``Box.info()`` AP
 
 from typing import TYPE_CHECKING
 
+from ._execution import SyncExecution
+from ._network import SyncNetworkHandle
+
 if TYPE_CHECKING:
     from ..boxlite import Box, BoxMetrics
     from ._boxlite import SyncBoxlite
-    from ._execution import SyncExecution
-    from ._network import SyncNetworkHandle
 
 __all__ = ["SyncBox"]
 
@@ -37,6 +38,8 @@ class SyncBox:
             box.stop()
     """
 
+    __slots__ = ("_box", "_network", "_runtime", "_sync_helper")
+
     def __init__(
         self,
         runtime: "SyncBoxlite",
@@ -49,12 +52,10 @@ class SyncBox:
             runtime: The SyncBoxlite runtime providing event loop and dispatcher
             box: The native Box object to wrap
         """
-        from ._sync_base import SyncBase
-
         self._box = box
         self._runtime = runtime
-        # Create a SyncBase helper for _sync() method
-        self._sync_helper = SyncBase(box, runtime.loop, runtime.dispatcher_fiber)
+        # Share the runtime's SyncBase helper for _sync()
+        self._sync_helper = runtime.sync_helper
         self._network = None
 
     def _sync(self, coro):
@@ -93,7 +94,7 @@ class SyncBox:
         args: list[str] | None = None,
         env: list[tuple[str, str]] | None = None,
         tty: bool = False,
-    ) -> "SyncExecution":
+    ) -> SyncExecution:
         """
         Execute a command in the box.
 
@@ -113,8 +114,6 @@ class SyncBox:
             result = execution.wait()
             print(f"Exit code: {result.exit_code}")
         """
-        from ._execution import SyncExecution
-
         # Run the async exec and get the Execution handle
         execution = self._sync(self._box.exec(cmd, args, env, tty))
         return SyncExecution(self._runtime, execution)
@@ -128,11 +127,9 @@ class SyncBox:
         return self._sync(self._box.metrics())
 
     @property
-    def network(self) -> "SyncNetworkHandle":
+    def network(self) -> SyncNetworkHandle:
         """Get the box-scoped network handle."""
         if self._network is None:
-            from ._network import SyncNetworkHandle
-
             self._network = SyncNetworkHandle(self)
         return self._network
 
@@ -7,19 +7,55 @@ for the synchronous BoxLite API.
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING, Optional
+import os
+from typing import TYPE_CHECKING
 
 from greenlet import greenlet
 
+from ._box import SyncBox
+from ._images import SyncImageHandle
+from ._sync_base import SyncBase
+
 if TYPE_CHECKING:
     from ..boxlite import Boxlite, BoxOptions, Options, RuntimeMetrics
-    from ._box import SyncBox
-    from ._images import SyncImageHandle
 
 logger = logging.getLogger("boxlite.sync_boxlite")
 
 __all__ = ["SyncBoxlite"]
 
+# With BOXLITE_SYNC_UVLOOP=1 the dispatcher runs on uvloop (pip install
+# boxlite[uvloop]); otherwise on asyncio's default loop, whatever is installed.
+_USE_UVLOOP = os.environ.get("BOXLITE_SYNC_UVLOOP") == "1"
+
+
+def _new_event_loop(use_uvloop: bool | None = None) -> asyncio.AbstractEventLoop:
+    """Create the dispatcher's event loop.
+
+    uvloop is used only when asked for (``use_uvloop``, defaulting to the
+    BOXLITE_SYNC_UVLOOP setting), never just because it happens to be
+    importable. On Python 3.12+ the loop gets the eager task factory, so
+    coroutines passed to ``_sync()`` run up to their first real suspension
+    without a loop turn.
+
+    Raises:
+        ImportError: If uvloop is requested but not installed.
+    """
+    if use_uvloop is None:
+        use_uvloop = _USE_UVLOOP
+    if use_uvloop:
+        try:
+            import uvloop
+        except ImportError as e:
+            raise ImportError(
+                "BOXLITE_SYNC_UVLOOP=1 requires uvloop: pip install 'boxlite[uvloop]'"
+            ) from e
+        loop = uvloop.new_event_loop()
+    else:
+        loop = asyncio.new_event_loop()
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
+
 
 class SyncBoxlite:
     """
@@ -51,6 +87,7 @@ class SyncBoxlite:
 
     Architecture:
         - Creates a dispatcher greenlet fiber that runs the event loop
+          (asyncio's default loop; uvloop's with BOXLITE_SYNC_UVLOOP=1)
         - User code runs in the main fiber
         - When user calls a sync method, it switches to dispatcher
         - Dispatcher processes the async task
@@ -70,6 +107,7 @@ class SyncBoxlite:
 
         self._loop: asyncio.AbstractEventLoop = None
         self._dispatcher_fiber: greenlet = None
+        self._shutdown_future: asyncio.Future | None = None
         self._own_loop = False
         self._sync_helper = None
         self._started = False
@@ -84,35 +122,34 @@ class SyncBoxlite:
         Raises:
             RuntimeError: If called from within an async context.
         """
-        # 1. Create event loop
-        try:
-            self._loop = asyncio.get_running_loop()
-        except RuntimeError:
-            self._loop = asyncio.new_event_loop()
-            self._own_loop = True
-
-        # 2. Check not in async context (loop shouldn't be running)
-        if self._loop.is_running():
+        # 1. Check not in async context (no loop may be running here).
+        # _get_running_loop() (C-backed, stable since 3.7) returns None
+        # rather than raising, keeping an exception off the normal path.
+        if asyncio._get_running_loop() is not None:
             raise RuntimeError(
                 "Cannot use SyncBoxlite inside an asyncio loop. "
                 "Use the async API (CodeBox, SimpleBox) instead."
             )
 
+        # 2. Create event loop
+        self._loop = _new_event_loop()
+        self._own_loop = True
+
         # 3. Create dispatcher fiber
+        self._shutdown_future = self._loop.create_future()
+
         def greenlet_main() -> None:
             """
             Dispatcher fiber entry point.
 
-            Runs the event loop indefinitely until stop() is called.
+            Runs the event loop until stop() resolves the shutdown future.
             The event loop efficiently waits for I/O events (via OS-level
             epoll/kqueue) and processes tasks scheduled by _sync() calls.
             """
-            self._loop.run_forever()
+            self._loop.run_until_complete(self._shutdown_future)
 
         self._dispatcher_fiber = greenlet(greenlet_main)
 
-        from ._sync_base import SyncBase
-
         self._sync_helper = SyncBase(self._boxlite, self._loop, self._dispatcher_fiber)
 
         # 5. Start dispatcher fiber
@@ -137,8 +174,9 @@ class SyncBoxlite:
         """
         self._started = False
 
-        # Signal the event loop to stop, then switch to let it finish cleanly
-        self._loop.call_soon(self._loop.stop)
+        # Resolve the future the dispatcher is parked on, then switch to let
+        # run_until_complete() return cleanly
+        self._shutdown_future.set_result(None)
         self._dispatcher_fiber.switch()
 
         if self._own_loop:
@@ -232,6 +270,7 @@ class SyncBoxlite:
 
         instance._loop = None
         instance._dispatcher_fiber = None
+        instance._shutdown_future = None
         instance._own_loop = False
         instance._sync_helper = None
         instance._started = False
@@ -247,8 +286,20 @@ class SyncBoxlite:
             )
 
     def _sync(self, coro):
-        """Run async operation synchronously."""
-        self._require_started()
+        """Run async operation synchronously.
+
+        For the wrappers that call this directly: raises the "not started"
+        RuntimeError on a stopped runtime. Runtime methods check
+        ``_require_started()`` before building their native awaitable (which
+        already needs the dispatcher loop) and go straight to the helper, so
+        each of their calls checks once.
+        """
+        if not self._started:
+            # Close the coroutine so it doesn't warn about never being awaited
+            close = getattr(coro, "close", None)
+            if close is not None:
+                close()
+            self._require_started()
         return self._sync_helper._sync(coro)
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -259,7 +310,7 @@ class SyncBoxlite:
         self,
         options: "BoxOptions",
         name: str | None = None,
-    ) -> "SyncBox":
+    ) -> SyncBox:
         """
         Create a new box.
 
@@ -278,16 +329,14 @@ class SyncBoxlite:
                 box = runtime.create(BoxOptions(image="alpine:latest"))
         """
         self._require_started()
-        from ._box import SyncBox
-
-        native_box = self._sync(self._boxlite.create(options, name=name))
+        native_box = self._sync_helper._sync(self._boxlite.create(options, name=name))
         return SyncBox(self, native_box)
 
     def get_or_create(
         self,
         options: "BoxOptions",
         name: str | None = None,
-    ) -> tuple["SyncBox", bool]:
+    ) -> tuple[SyncBox, bool]:
         """
         Get an existing box by name, or create a new one.
 
@@ -299,14 +348,12 @@ class SyncBoxlite:
             Tuple of (SyncBox, created) where created is True if newly created.
         """
         self._require_started()
-        from ._box import SyncBox
-
-        native_box, created = self._sync(
+        native_box, created = self._sync_helper._sync(
             self._boxlite.get_or_create(options, name=name)
         )
         return SyncBox(self, native_box), created
 
-    def get(self, id_or_name: str) -> Optional["SyncBox"]:
+    def get(self, id_or_name: str) -> SyncBox | None:
         """
         Get an existing box by ID or name.
 
@@ -317,9 +364,7 @@ class SyncBoxlite:
             SyncBox if found, None otherwise.
         """
         self._require_started()
-        from ._box import SyncBox
-
-        native_box = self._sync(self._boxlite.get(id_or_name))
+        native_box = self._sync_helper._sync(self._boxlite.get(id_or_name))
         if native_box is None:
             return None
         return SyncBox(self, native_box)
@@ -332,14 +377,12 @@ class SyncBoxlite:
             RuntimeMetrics with aggregate statistics.
         """
         self._require_started()
-        return self._sync(self._boxlite.metrics())
+        return self._sync_helper._sync(self._boxlite.metrics())
 
     @property
-    def images(self) -> "SyncImageHandle":
+    def images(self) -> SyncImageHandle:
         """Get the runtime image handle."""
         self._require_started()
-        from ._images import SyncImageHandle
-
         return SyncImageHandle(self, self._boxlite.images)
 
     def remove(self, id_or_name: str, force: bool = False) -> None:
@@ -350,7 +393,8 @@ class SyncBoxlite:
             id_or_name: Box ID or name to remove.
             force: Force removal even if box is running.
         """
-        self._sync(self._boxlite.remove(id_or_name, force))
+        self._require_started()
+        self._sync_helper._sync(self._boxlite.remove(id_or_name, force))
 
     def shutdown(self, timeout: int | None = None) -> None:
         """
@@ -368,7 +412,8 @@ class SyncBoxlite:
                 - Positive integer - Wait that many seconds
                 - -1 - Wait indefinitely (no timeout)
         """
-        self._sync(self._boxlite.shutdown(timeout))
+        self._require_started()
+        self._sync_helper._sync(self._boxlite.shutdown(timeout))
 
     # ─────────────────────────────────────────────────────────────────────────
     # Properties for internal use by SyncBox/SyncExecution
@@ -384,6 +429,11 @@ class SyncBoxlite:
         """Get the dispatcher greenlet fiber."""
         return self._dispatcher_fiber
 
+    @property
+    def sync_helper(self) -> SyncBase:
+        """Get the SyncBase helper shared by every wrapper on this runtime."""
+        return self._sync_helper
+
     @property
     def runtime(self) -> "Boxlite":
         """Get the underlying native Boxlite runtime (for internal/advanced use)."""
@@ -5,8 +5,10 @@ Provides a synchronous API for Python code execution using greenlet fiber switch
 Box metadata remains async-only and is not exposed by this wrapper.
 """
 
+import asyncio
 from typing import TYPE_CHECKING, Optional
 
+from ..codebox import _read_text_file
 from ._simplebox import SyncSimpleBox
 
 if TYPE_CHECKING:
@@ -134,14 +136,20 @@ class SyncCodeBox(SyncSimpleBox):
         Reads the script from the host filesystem and executes it in the box.
 
         Args:
-            script_path: Path to the Python script on the host
+            script_path: Path to the Python script on the host. The file must
+                be UTF-8 encoded (a leading BOM is allowed), whatever the
+                host locale.
 
         Returns:
             Script stdout as a string
 
+        Raises:
+            UnicodeDecodeError: If the file is not valid UTF-8
+
         Example:
             result = box.run_script("./my_script.py")
         """
-        with open(script_path, "r") as f:
-            code = f.read()
+        # Read on a worker thread, like CodeBox.run_script, so the dispatcher
+        # loop keeps servicing in-flight I/O while the disk read runs.
+        code = self._runtime._sync(asyncio.to_thread(_read_text_file, script_path))
         return self.run(code)
@@ -4,14 +4,145 @@ SyncExecution - Synchronous wrapper for Execution.
 Mirrors the native Execution API exactly, but with synchronous methods.
 """
 
+import asyncio
+import logging
+from collections import deque
 from typing import TYPE_CHECKING
 
+from ..exec import ExecResult, _join_output
+
 if TYPE_CHECKING:
     from ..boxlite import Execution
     from ._boxlite import SyncBoxlite
 
+logger = logging.getLogger("boxlite.sync_execution")
+
 __all__ = ["SyncExecStderr", "SyncExecStdin", "SyncExecStdout", "SyncExecution"]
 
+# Max lines handed over per dispatcher round-trip by the stdout/stderr iterators
+_BATCH_SIZE = 64
+
+
+async def _next_batch(anext, pending, limit: int):
+    """
+    Wait for the next line, then collect any further lines already available.
+
+    Reads are never abandoned: one still in flight (or one that failed, e.g.
+    end of stream) is returned as ``pending`` and awaited first on the next
+    call, so lines, errors and EOF all surface in order.
+
+    Returns:
+        ``(lines, pending)``; ``lines`` is empty once the stream is exhausted.
+    """
+    fut = pending if pending is not None else asyncio.ensure_future(anext())
+    try:
+        lines = [await fut]
+    except StopAsyncIteration:
+        return [], None
+    while len(lines) < limit:
+        fut = asyncio.ensure_future(anext())
+        if not fut.done():
+            # Give reads that are already satisfiable one loop turn to land
+            await asyncio.sleep(0)
+        if not fut.done() or fut.exception() is not None:
+            return lines, fut
+        lines.append(fut.result())
+    return lines, None
+
+
+def _discard_read(fut) -> None:
+    """Abandon a read-ahead from ``_next_batch`` that nobody will await.
+
+    A read still in flight is cancelled; a finished one has its exception (if
+    any) marked as retrieved, so the loop doesn't log "Task exception was
+    never retrieved" for a stream the caller stopped reading.
+    """
+    if not fut.done():
+        fut.cancel()
+    elif not fut.cancelled():
+        fut.exception()
+
+
+def _decode_lines(lines: list) -> list:
+    """Decode a batch of stream lines to str, checking the type once per batch.
+
+    A stream yields either bytes or str throughout (the native streams yield
+    str), so the first line decides for the whole batch.
+    """
+    if isinstance(lines[0], bytes):
+        return [line.decode("utf-8", errors="replace") for line in lines]
+    return lines
+
+
+async def _collect_output(execution: "Execution") -> ExecResult:
+    """
+    Drain stdout and stderr and wait for exit, as a single coroutine.
+
+    Both streams and the exit status are awaited concurrently: reading the
+    streams one after the other can deadlock once the process fills the pipe
+    buffer of the stream not being read. Run through one ``_sync()`` call
+    this costs a single dispatcher round-trip for the whole command.
+
+    Native executions collect everything inside Tokio via
+    ``collect_output()``; other awaitable executions are drained here.
+    """
+    collect_native = getattr(execution, "collect_output", None)
+    if collect_native is not None:
+        exit_code, stdout, stderr, error_message = await collect_native()
+        return ExecResult(
+            exit_code=exit_code,
+            stdout=stdout,
+            stderr=stderr,
+            error_message=error_message,
+        )
+
+    stdout_chunks = []
+    stderr_chunks = []
+
+    try:
+        stdout_stream = execution.stdout()
+    except Exception as e:  # noqa: BLE001 - native binding call; fall back to no stdout stream
+        logger.error(f"take stdout err: {e}")
+        stdout_stream = None
+
+    try:
+        stderr_stream = execution.stderr()
+    except Exception as e:  # noqa: BLE001 - native binding call; fall back to no stderr stream
+        logger.error(f"take stderr err: {e}")
+        stderr_stream = None
+
+    async def drain(stream, chunks: list, name: str) -> None:
+        if not stream:
+            return
+        try:
+            async for chunk in stream:
+                chunks.append(chunk)
+        except Exception as e:  # noqa: BLE001 - stream collection must not crash exec(); partial output is acceptable
+            logger.error(f"collecting {name} err: {e}")
+
+    async def wait_for_exit():
+        # Same (exit_code, error_message) as native collect_output() reports
+        try:
+            exec_result = await execution.wait()
+        except Exception as e:  # noqa: BLE001 - native binding call; report failure via exit_code instead of raising
+            logger.error(f"failed to wait execution: {e}")
+            return -1, str(e)
+        return exec_result.exit_code, exec_result.error_message
+
+    # The exit status is awaited alongside the drains, not after them
+    _, _, (exit_code, error_message) = await asyncio.gather(
+        drain(stdout_stream, stdout_chunks, "stdout"),
+        drain(stderr_stream, stderr_chunks, "stderr"),
+        wait_for_exit(),
+    )
+
+    return ExecResult(
+        exit_code=exit_code,
+        stdout=_join_output(stdout_chunks),
+        stderr=_join_output(stderr_chunks),
+        error_message=error_message,
+    )
+
 
 class SyncExecStdin:
     """
@@ -23,13 +154,12 @@ class SyncExecStdin:
         stdin.close()
     """
 
+    __slots__ = ("_async_stdin", "_ctx", "_sync_helper")
+
     def __init__(self, ctx: "SyncBoxlite", async_stdin) -> None:
         self._ctx = ctx
         self._async_stdin = async_stdin
-
-        from ._sync_base import SyncBase
-
-        self._sync_helper = SyncBase(async_stdin, ctx.loop, ctx.dispatcher_fiber)
+        self._sync_helper = ctx.sync_helper
 
     def _sync(self, coro):
         """Run async operation synchronously."""
@@ -44,94 +174,106 @@ class SyncExecStdin:
         self._sync(self._async_stdin.close())
 
 
-class SyncExecStdout:
+class _SyncExecStream:
     """
-    Synchronous iterator for execution stdout.
+    Synchronous line iterator over an async execution output stream.
 
-    Mirrors ExecStdout but uses regular iteration instead of async iteration.
+    Shared implementation of SyncExecStdout and SyncExecStderr, which differ
+    only in the stream they wrap.
 
-    Usage:
-        stdout = execution.stdout()
-        for line in stdout:
-            print(line)
+    Each batch leaves the next read running ahead on the dispatcher loop.
+    Stopping early is fine: ``close()``, or dropping the iterator, cancels
+    that read instead of leaving it orphaned on the loop.
     """
 
-    def __init__(self, ctx: "SyncBoxlite", async_stdout) -> None:
+    __slots__ = (
+        "_async_iter",
+        "_async_stream",
+        "_buffer",
+        "_closed",
+        "_ctx",
+        "_pending",
+        "_sync_helper",
+    )
+
+    def __init__(self, ctx: "SyncBoxlite", async_stream) -> None:
         self._ctx = ctx
-        self._async_stdout = async_stdout
+        self._async_stream = async_stream
         self._async_iter = None
-
-        from ._sync_base import SyncBase
-
-        self._sync_helper = SyncBase(async_stdout, ctx.loop, ctx.dispatcher_fiber)
+        self._pending = None
+        self._closed = False
+        self._buffer = deque()
+        self._sync_helper = ctx.sync_helper
 
     def _sync(self, coro):
         """Run async operation synchronously."""
         return self._sync_helper._sync(coro)
 
-    def __iter__(self) -> "SyncExecStdout":
+    def __iter__(self):
         """Start iteration."""
-        self._async_iter = self._async_stdout.__aiter__()
+        self._async_iter = self._async_stream.__aiter__()
         return self
 
     def __next__(self) -> str:
-        """Get next line from stdout."""
-        if self._async_iter is None:
-            self._async_iter = self._async_stdout.__aiter__()
+        """Get next line from the stream."""
+        if not self._buffer:
+            if self._closed:
+                raise StopIteration
+            if self._async_iter is None:
+                self._async_iter = self._async_stream.__aiter__()
+            # Pull every line that is ready in one round-trip to the dispatcher
+            lines, self._pending = self._sync(
+                _next_batch(self._async_iter.__anext__, self._pending, _BATCH_SIZE)
+            )
+            if not lines:
+                raise StopIteration
+            self._buffer.extend(_decode_lines(lines))
+
+        return self._buffer.popleft()
 
+    def close(self) -> None:
+        """Stop reading the stream; iteration ends and buffered lines are dropped."""
+        self._closed = True
+        self._buffer.clear()
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            _discard_read(pending)
+
+    def __del__(self) -> None:
         try:
-            line = self._sync(self._async_iter.__anext__())
-            # Decode bytes to string if needed
-            if isinstance(line, bytes):
-                return line.decode("utf-8", errors="replace")
-            return line
-        except StopAsyncIteration:
-            raise StopIteration
+            self.close()
+        except Exception:  # noqa: BLE001, S110 - the loop may already be closed; nothing left to clean up
+            pass
 
 
-class SyncExecStderr:
+class SyncExecStdout(_SyncExecStream):
     """
-    Synchronous iterator for execution stderr.
+    Synchronous iterator for execution stdout.
 
-    Mirrors ExecStderr but uses regular iteration instead of async iteration.
+    Mirrors ExecStdout but uses regular iteration instead of async iteration.
 
     Usage:
-        stderr = execution.stderr()
-        for line in stderr:
+        stdout = execution.stdout()
+        for line in stdout:
             print(line)
     """
 
-    def __init__(self, ctx: "SyncBoxlite", async_stderr) -> None:
-        self._ctx = ctx
-        self._async_stderr = async_stderr
-        self._async_iter = None
-
-        from ._sync_base import SyncBase
+    __slots__ = ()
 
-        self._sync_helper = SyncBase(async_stderr, ctx.loop, ctx.dispatcher_fiber)
 
-    def _sync(self, coro):
-        """Run async operation synchronously."""
-        return self._sync_helper._sync(coro)
+class SyncExecStderr(_SyncExecStream):
+    """
+    Synchronous iterator for execution stderr.
 
-    def __iter__(self) -> "SyncExecStderr":
-        """Start iteration."""
-        self._async_iter = self._async_stderr.__aiter__()
-        return self
+    Mirrors ExecStderr but uses regular iteration instead of async iteration.
 
-    def __next__(self) -> str:
-        """Get next line from stderr."""
-        if self._async_iter is None:
-            self._async_iter = self._async_stderr.__aiter__()
+    Usage:
+        stderr = execution.stderr()
+        for line in stderr:
+            print(line)
+    """
 
-        try:
-            line = self._sync(self._async_iter.__anext__())
-            # Decode bytes to string if needed
-            if isinstance(line, bytes):
-                return line.decode("utf-8", errors="replace")
-            return line
-        except StopAsyncIteration:
-            raise StopIteration
+    __slots__ = ()
 
 
 class SyncExecution:
@@ -157,6 +299,8 @@ class SyncExecution:
         print(f"Exit code: {result.exit_code}")
     """
 
+    __slots__ = ("_ctx", "_execution", "_sync_helper")
+
     def __init__(
         self,
         ctx: "SyncBoxlite",
@@ -169,11 +313,9 @@ class SyncExecution:
             ctx: The SyncBoxlite providing event loop and dispatcher
             execution: The native Execution object to wrap
         """
-        from ._sync_base import SyncBase
-
         self._execution = execution
         self._ctx = ctx
-        self._sync_helper = SyncBase(execution, ctx.loop, ctx.dispatcher_fiber)
+        self._sync_helper = ctx.sync_helper
 
     def _sync(self, coro):
         """Run async operation synchronously."""
@@ -247,6 +389,20 @@ class SyncExecution:
         """
         return self._sync(self._execution.wait())
 
+    def wait_with_output(self) -> ExecResult:
+        """
+        Collect all output and wait for completion in one round-trip.
+
+        Drains stdout and stderr concurrently (so neither pipe can fill up and
+        stall the process) and waits for exit, all inside a single dispatcher
+        switch. Use this instead of iterating stdout()/stderr() and calling
+        wait() when the output is only needed as a whole.
+
+        Returns:
+            ExecResult with exit_code, stdout and stderr.
+        """
+        return self._sync(_collect_output(self._execution))
+
     def kill(self) -> None:
         """Kill the running execution."""
         self._sync(self._execution.kill())
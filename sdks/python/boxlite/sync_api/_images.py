@@ -19,11 +19,9 @@ class SyncImageHandle:
     """
 
     def __init__(self, runtime: "SyncBoxlite", handle: "ImageHandle") -> None:
-        from ._sync_base import SyncBase
-
         self._runtime = runtime
         self._handle = handle
-        self._sync_helper = SyncBase(handle, runtime.loop, runtime.dispatcher_fiber)
+        self._sync_helper = runtime.sync_helper
 
     def _sync(self, coro):
         return self._sync_helper._sync(coro)
@@ -5,20 +5,53 @@ Provides a synchronous API for box operations.
 Async-only metadata retrieval is not exposed.
 """
 
-import asyncio
 import logging
+import os
+import threading
 from typing import TYPE_CHECKING, Optional
 
 from ..exec import ExecResult
+from ._boxlite import SyncBoxlite
+from ._execution import _collect_output
 
 if TYPE_CHECKING:
     from ._box import SyncBox
-    from ._boxlite import SyncBoxlite
 
 logger = logging.getLogger("boxlite.sync_simplebox")
 
 __all__ = ["SyncSimpleBox"]
 
+# Native BoxOptions, resolved on first construction (the extension may not be
+# importable when this module is)
+_BoxOptions = None
+
+# With BOXLITE_SHARED_DEFAULT_RUNTIME=1, boxes created without an explicit
+# runtime share one started default runtime per thread (the dispatcher fiber
+# can't be switched to from another thread) instead of each starting and
+# stopping their own. It is stopped when the last such box exits.
+_SHARE_DEFAULT_RUNTIME = os.environ.get("BOXLITE_SHARED_DEFAULT_RUNTIME") == "1"
+_shared_default = threading.local()
+
+
+def _acquire_shared_runtime() -> SyncBoxlite:
+    """Return this thread's shared default runtime, starting it on first use."""
+    runtime = getattr(_shared_default, "runtime", None)
+    if runtime is None:
+        runtime = SyncBoxlite.default().start()
+        _shared_default.runtime = runtime
+        _shared_default.refs = 0
+    _shared_default.refs += 1
+    return runtime
+
+
+def _release_shared_runtime() -> None:
+    """Drop one reference; stop the shared runtime when none remain."""
+    _shared_default.refs -= 1
+    if _shared_default.refs == 0:
+        runtime = _shared_default.runtime
+        _shared_default.runtime = None
+        runtime.stop()
+
 
 class SyncSimpleBox:
     """
@@ -60,7 +93,8 @@ class SyncSimpleBox:
             rootfs_path: Path to local OCI layout directory (overrides image if provided)
             memory_mib: Memory limit in MiB (default: system default)
             cpus: Number of CPU cores (default: system default)
-            runtime: Optional SyncBoxlite runtime. If None, creates default runtime.
+            runtime: Optional SyncBoxlite runtime. If None, creates default runtime
+                (shared per thread when BOXLITE_SHARED_DEFAULT_RUNTIME=1).
             name: Optional unique name for the box
             auto_remove: Remove box when stopped (default: True)
             reuse_existing: If True and a box with the given name already exists,
@@ -72,12 +106,14 @@ class SyncSimpleBox:
         if not image and not rootfs_path:
             raise ValueError("Either 'image' or 'rootfs_path' must be provided")
 
-        from ..boxlite import BoxOptions
-        from ._boxlite import SyncBoxlite
+        global _BoxOptions
+        if _BoxOptions is None:
+            from ..boxlite import BoxOptions as _BoxOptions
 
-        # Handle optional runtime
+        # Handle optional runtime (a shared one is acquired in __enter__)
         if runtime is None:
-            runtime = SyncBoxlite.default()
+            if not _SHARE_DEFAULT_RUNTIME:
+                runtime = SyncBoxlite.default()
             self._owns_runtime = True
         else:
             self._owns_runtime = False
@@ -85,7 +121,7 @@ class SyncSimpleBox:
         self._runtime = runtime
 
         # Create box options
-        self._box_opts = BoxOptions(
+        self._box_opts = _BoxOptions(
             image=image,
             rootfs_path=rootfs_path,
             cpus=cpus,
@@ -108,16 +144,24 @@ class SyncSimpleBox:
         """
         # Start runtime if we own it
         if self._owns_runtime:
-            self._runtime.start()
+            if _SHARE_DEFAULT_RUNTIME:
+                self._runtime = _acquire_shared_runtime()
+            else:
+                self._runtime.start()
 
         # Create or reuse box via runtime
-        if self._reuse_existing:
-            self._box, self._created = self._runtime.get_or_create(
-                self._box_opts, name=self._name
-            )
-        else:
-            self._box = self._runtime.create(self._box_opts, name=self._name)
-            self._created = True
+        try:
+            if self._reuse_existing:
+                self._box, self._created = self._runtime.get_or_create(
+                    self._box_opts, name=self._name
+                )
+            else:
+                self._box = self._runtime.create(self._box_opts, name=self._name)
+                self._created = True
+        except BaseException:
+            # __exit__ won't run, so give the runtime back here
+            self._stop_owned_runtime()
+            raise
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -126,9 +170,15 @@ class SyncSimpleBox:
         if self._box is not None:
             self._box.stop()
 
-        # Stop runtime if we own it
+        self._stop_owned_runtime()
+
+    def _stop_owned_runtime(self) -> None:
+        """Stop the runtime if we own it, or drop our shared reference."""
         if self._owns_runtime:
-            self._runtime.stop()
+            if _SHARE_DEFAULT_RUNTIME:
+                _release_shared_runtime()
+            else:
+                self._runtime.stop()
 
     @property
     def id(self) -> str:
@@ -181,8 +231,8 @@ class SyncSimpleBox:
         # the greenlet bridge. This avoids the deadlock that occurs with
         # sequential sync iteration (stdout then stderr), where filling one
         # pipe buffer blocks the process while we're reading the other.
-        arg_list = list(args) if args else None
-        env_list = list(env.items()) if env else None
+        arg_list = args or None
+        env_list = env or None
 
         # Access the underlying async Box directly
         async_box = self._box._box
@@ -192,62 +242,7 @@ class SyncSimpleBox:
                 cmd, arg_list, env_list, user=user, timeout_secs=timeout, cwd=cwd
             )
 
-            stdout_lines = []
-            stderr_lines = []
-
-            try:
-                stdout_stream = execution.stdout()
-            except Exception as e:  # noqa: BLE001 - native binding call; fall back to no stdout stream
-                logger.error(f"take stdout err: {e}")
-                stdout_stream = None
-
-            try:
-                stderr_stream = execution.stderr()
-            except Exception as e:  # noqa: BLE001 - native binding call; fall back to no stderr stream
-                logger.error(f"take stderr err: {e}")
-                stderr_stream = None
-
-            async def collect_stdout():
-                if not stdout_stream:
-                    return
-                try:
-                    async for line in stdout_stream:
-                        if isinstance(line, bytes):
-                            stdout_lines.append(line.decode("utf-8", errors="replace"))
-                        else:
-                            stdout_lines.append(line)
-                except Exception as e:  # noqa: BLE001 - stream collection must not crash exec(); partial output is acceptable
-                    logger.error(f"collecting stdout err: {e}")
-
-            async def collect_stderr():
-                if not stderr_stream:
-                    return
-                try:
-                    async for line in stderr_stream:
-                        if isinstance(line, bytes):
-                            stderr_lines.append(line.decode("utf-8", errors="replace"))
-                        else:
-                            stderr_lines.append(line)
-                except Exception as e:  # noqa: BLE001 - stream collection must not crash exec(); partial output is acceptable
-                    logger.error(f"collecting stderr err: {e}")
-
-            await asyncio.gather(collect_stdout(), collect_stderr())
-
-            error_message = None
-            try:
-                exec_result = await execution.wait()
-                exit_code = exec_result.exit_code
-                error_message = exec_result.error_message
-            except Exception as e:  # noqa: BLE001 - native binding call; report failure via exit_code instead of raising
-                logger.error(f"failed to wait execution: {e}")
-                exit_code = -1
-
-            return ExecResult(
-                exit_code=exit_code,
-                stdout="".join(stdout_lines),
-                stderr="".join(stderr_lines),
-                error_message=error_message,
-            )
+            return await _collect_output(execution)
 
         return self._runtime._sync(_exec_and_collect())
 
@@ -439,12 +439,8 @@ class SyncSkillBox(SyncSimpleBox):
                 logger.warning("Timeout waiting for response")
                 break
 
-            if isinstance(chunk, bytes):
-                chunk_str = chunk.decode("utf-8", errors="replace")
-            else:
-                chunk_str = chunk
-
-            buffer += chunk_str
+            # SyncExecStdout already yields str (decoded once per batch)
+            buffer += chunk
 
             # Process complete lines
             while "\n" in buffer:
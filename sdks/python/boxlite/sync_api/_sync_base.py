@@ -3,12 +3,24 @@ Base class for sync wrappers - provides _sync() method.
 
 This module contains the core bridging logic that allows sync code to
 execute async operations using greenlet fiber switching.
+
+Why a dispatcher fiber rather than ``loop.run_until_complete(coro)`` per
+call: the native methods (e.g. ``box.exec(...)``) build their awaitable
+with ``pyo3_async_runtimes::tokio::future_into_py``, which looks up the
+*running* event loop when called. Those calls happen in user code, before
+``_sync()`` is reached, so the loop has to stay running across them. The
+dispatcher fiber keeps ``run_until_complete`` suspended on its own stack
+while user code runs in the main fiber, on the same thread. Running the loop
+on a dedicated thread instead (``run_coroutine_threadsafe``) fails the same
+way: the running loop is tracked per thread, so the user's thread has none.
 """
 
 import asyncio
-import inspect
+import sys
 import traceback
+from asyncio import Future
 from collections.abc import Awaitable, Coroutine
+from types import CoroutineType
 from typing import Any, TypeVar
 
 from greenlet import greenlet
@@ -17,6 +29,21 @@ __all__ = ["SyncBase", "SyncContextManager"]
 
 T = TypeVar("T")
 
+_ensure_future = asyncio.ensure_future
+
+
+def _caller_stack(limit: int = 10) -> traceback.StackSummary:
+    """Summarize the innermost ``limit`` frames of the current stack.
+
+    Like ``traceback.extract_stack()`` but without reading source lines up
+    front; each ``FrameSummary.line`` is loaded from linecache on first use.
+    """
+    stack = traceback.StackSummary.extract(
+        traceback.walk_stack(sys._getframe(1)), limit=limit, lookup_lines=False
+    )
+    stack.reverse()
+    return stack
+
 
 class SyncBase:
     """
@@ -52,6 +79,11 @@ class SyncBase:
         self._impl = impl_obj
         self._loop = loop
         self._dispatcher_fiber = dispatcher_fiber
+        # Everything _sync() needs is fixed from here on, so bind it once
+        # into a closure; subclasses overriding _sync() keep their override
+        self._sync_impl = self._make_sync()
+        if type(self)._sync is SyncBase._sync:
+            self._sync = self._sync_impl
 
     def _sync(
         self,
@@ -64,9 +96,22 @@ class SyncBase:
 
         The method:
         1. Creates an asyncio task from the coroutine
-        2. Registers a callback to switch back when task completes
-        3. Switches to dispatcher fiber to let event loop run
-        4. Returns the task result (or raises exception)
+        2. Returns straight away if the task already finished (a coroutine
+           that never suspends, run eagerly by the dispatcher loop's task
+           factory on Python 3.12+)
+        3. Otherwise registers a callback to switch back when task completes
+           and switches to the dispatcher fiber once; only the callback
+           switches back
+        4. Returns the task result, or raises its exception annotated with
+           the caller's stack as ``__boxlite_stack__``
+
+        Coroutines are not stepped by hand here (``coro.send(None)``): a
+        coroutine that suspends must be resumed by the Task that owns it, and
+        code run outside a Task would see no ``current_task()``. The eager
+        task factory gives the same fast path without those pitfalls.
+
+        Instances normally call the closure built by ``_make_sync()``
+        directly; this method remains for ``super()._sync()`` in overrides.
 
         Args:
             coro: The async coroutine to execute
@@ -79,38 +124,68 @@ class SyncBase:
             Any exception raised by the coroutine
         """
         __tracebackhide__ = True  # Hide from pytest tracebacks
-
-        # Guard: event loop must be open
-        if self._loop.is_closed():
-            if hasattr(coro, "close"):
-                coro.close()
-            raise RuntimeError("Event loop is closed! Is BoxLite stopped?")
-
-        # 1. Get current fiber (user fiber)
-        g_self = greenlet.getcurrent()
-
-        # 2. Create async task from coroutine/future
-        # Note: PyO3's async methods return Future objects (not native coroutines),
-        # so we use ensure_future() which handles both coroutines and futures.
-        task: asyncio.Task = asyncio.ensure_future(coro, loop=self._loop)
-
-        # 3. Attach debug info for better stack traces
-        task.__boxlite_stack__ = inspect.stack(0)
-        task.__boxlite_stack_trace__ = traceback.extract_stack(limit=10)
-
-        # 4. When task completes, switch back to us
-        task.add_done_callback(lambda _: g_self.switch())
-
-        # 5. THE CORE LOOP: Keep switching to dispatcher until done
-        while not task.done():
-            self._dispatcher_fiber.switch()
-            # ^^^^^ Control goes to dispatcher fiber
-            # Dispatcher runs event loop, processes our task
-            # When task completes, callback fires g_self.switch()
-            # Control returns HERE
-
-        # 6. Return result (or raise exception)
-        return task.result()
+        return self._sync_impl(coro)
+
+    def _make_sync(self):
+        """Build ``_sync()`` with the loop and dispatcher bound as free variables."""
+        loop = self._loop
+        loop_is_closed = loop.is_closed
+        getcurrent = greenlet.getcurrent
+        switch_to_dispatcher = self._dispatcher_fiber.switch
+        create_task = loop.create_task
+        ensure_future = _ensure_future
+
+        def _sync(coro):
+            __tracebackhide__ = True  # Hide from pytest tracebacks
+
+            # Guard: event loop must be open
+            if loop_is_closed():
+                # Coroutines are closed so they don't warn about never being
+                # awaited; plain futures have no close()
+                try:
+                    coro.close()
+                except AttributeError:
+                    pass
+                raise RuntimeError("Event loop is closed! Is BoxLite stopped?")
+
+            # 1. Create async task from coroutine/future
+            # Note: PyO3's async methods return Future objects (not native
+            # coroutines). The two common types are dispatched directly: a
+            # Future on our loop is awaited as-is (no Task allocated), a
+            # coroutine gets the Task that drives it. Anything else goes
+            # through ensure_future(), which also rejects foreign loops.
+            coro_type = type(coro)
+            if coro_type is Future and coro.get_loop() is loop:
+                task = coro
+            elif coro_type is CoroutineType:
+                task = create_task(coro)
+            else:
+                task = ensure_future(coro, loop=loop)
+
+            # Fast path: with an eager task factory a coroutine that never
+            # suspends is already finished here, so skip the fiber round-trip.
+            if not task.done():
+                # 2. When task completes, switch back to us (the current user
+                # fiber). greenlet passes the callback argument - the finished
+                # task - through as the return value of our switch() below.
+                task.add_done_callback(getcurrent().switch)
+
+                # 3. Switch to the dispatcher once. It runs the event loop
+                # until the done callback above resumes us, the only way back.
+                if switch_to_dispatcher() is not task:
+                    raise RuntimeError(
+                        "Dispatcher fiber resumed _sync() before its task finished"
+                    )
+
+            # 4. Return result (or raise exception). The caller's stack is
+            # only captured for failures, so successful calls never walk it.
+            try:
+                return task.result()
+            except BaseException as e:
+                e.__boxlite_stack__ = _caller_stack()
+                raise
+
+        return _sync
 
 
 class SyncContextManager(SyncBase):
@@ -9,6 +9,31 @@ use crate::snapshots::PySnapshotHandle;
 use crate::util::map_err;
 use boxlite::{BoxCommand, CloneOptions, ExportOptions, LiteBox};
 use pyo3::prelude::*;
+use pyo3::types::PyDict;
+
+/// Environment for `Box.exec`: a dict, or a sequence of `(key, value)` pairs.
+///
+/// Accepting the dict directly spares callers building a list of item tuples
+/// on every call.
+pub(crate) struct PyExecEnv(Vec<(String, String)>);
+
+impl<'a, 'py> pyo3::FromPyObject<'a, 'py> for PyExecEnv {
+    type Error = PyErr;
+
+    fn extract(ob: Borrowed<'a, 'py, PyAny>) -> PyResult<Self> {
+        let obj = ob.to_owned();
+
+        if let Ok(d) = obj.cast::<PyDict>() {
+            let mut vars = Vec::with_capacity(d.len());
+            for (k, v) in d.iter() {
+                vars.push((k.extract()?, v.extract()?));
+            }
+            return Ok(PyExecEnv(vars));
+        }
+
+        Ok(PyExecEnv(obj.extract()?))
+    }
+}
 
 #[pyclass(name = "Box")]
 pub(crate) struct PyBox {
@@ -60,7 +85,7 @@ impl PyBox {
         py: Python<'a>,
         command: String,
         args: Option<Vec<String>>,
-        env: Option<Vec<(String, String)>>,
+        env: Option<PyExecEnv>,
         tty: bool,
         user: Option<String>,
         timeout_secs: Option<f64>,
@@ -73,7 +98,7 @@ impl PyBox {
         pyo3_async_runtimes::tokio::future_into_py(py, async move {
             let mut cmd = BoxCommand::new(command);
             cmd = cmd.args(args);
-            if let Some(env_vars) = env {
+            if let Some(PyExecEnv(env_vars)) = env {
                 for (k, v) in env_vars {
                     cmd = cmd.env(k, v);
                 }
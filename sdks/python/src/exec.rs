@@ -177,6 +177,43 @@ impl PyExecution {
         })
     }
 
+    /// Drain stdout and stderr and wait for exit, entirely inside Tokio.
+    ///
+    /// Resolves to `(exit_code, stdout, stderr, error_message)`. Both streams
+    /// and the exit status are awaited concurrently, so a full pipe on one
+    /// stream cannot stall the other, and no per-line Python objects are
+    /// created. A failed wait reports exit code -1 with its error message.
+    /// Takes the output streams, so stdout()/stderr() are unavailable after.
+    fn collect_output<'a>(&self, py: Python<'a>) -> PyResult<Bound<'a, PyAny>> {
+        let execution_ref = unsafe { &mut *(Arc::as_ptr(&self.execution) as *mut Execution) };
+        let stdout = execution_ref.stdout();
+        let stderr = execution_ref.stderr();
+        let execution = Arc::clone(&self.execution);
+
+        pyo3_async_runtimes::tokio::future_into_py(py, async move {
+            use futures::StreamExt;
+
+            async fn drain<S: futures::Stream<Item = String> + Unpin>(stream: Option<S>) -> String {
+                let mut out = String::new();
+                if let Some(mut stream) = stream {
+                    while let Some(chunk) = stream.next().await {
+                        out.push_str(&chunk);
+                    }
+                }
+                out
+            }
+
+            let (stdout, stderr, exec_result) =
+                futures::join!(drain(stdout), drain(stderr), execution.wait());
+
+            let (exit_code, error_message) = match exec_result {
+                Ok(result) => (result.exit_code, result.error_message),
+                Err(err) => (-1, Some(err.to_string())),
+            };
+            Ok((exit_code, stdout, stderr, error_message))
+        })
+    }
+
     fn kill<'a>(&self, py: Python<'a>) -> PyResult<Bound<'a, PyAny>> {
         let execution = Arc::clone(&self.execution);
 
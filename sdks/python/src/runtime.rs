@@ -19,11 +19,17 @@ pub(crate) struct PyBoxlite {
 #[pymethods]
 impl PyBoxlite {
     #[new]
-    fn new(options: PyOptions) -> PyResult<Self> {
+    fn new(py: Python<'_>, options: PyOptions) -> PyResult<Self> {
         let core_opts = options.into_core()?;
-        // Executable-owned logging init (the library no longer auto-installs a subscriber).
-        let _ = boxlite::init_logging_for(&core_opts.home_dir);
-        let runtime = BoxliteRuntime::new(core_opts).map_err(map_err)?;
+        // Runtime setup does blocking filesystem and database work; release the
+        // GIL for it so other Python threads keep running.
+        let runtime = py
+            .detach(|| {
+                // Executable-owned logging init (the library no longer auto-installs a subscriber).
+                let _ = boxlite::init_logging_for(&core_opts.home_dir);
+                BoxliteRuntime::new(core_opts)
+            })
+            .map_err(map_err)?;
 
         Ok(Self {
             runtime: Arc::new(runtime),
@@ -31,12 +37,16 @@ impl PyBoxlite {
     }
 
     #[staticmethod]
-    fn default() -> PyResult<Self> {
-        // Executable-owned logging init (the library no longer auto-installs a
-        // subscriber). The default runtime uses `BoxliteOptions::default()`, so
-        // we mirror its home_dir for the log location.
-        let _ = boxlite::init_logging_for(&BoxliteOptions::default().home_dir);
-        let runtime = BoxliteRuntime::default_runtime();
+    fn default(py: Python<'_>) -> PyResult<Self> {
+        // The first call initializes the shared runtime (blocking I/O), so
+        // release the GIL around it.
+        let runtime = py.detach(|| {
+            // Executable-owned logging init (the library no longer auto-installs a
+            // subscriber). The default runtime uses `BoxliteOptions::default()`, so
+            // we mirror its home_dir for the log location.
+            let _ = boxlite::init_logging_for(&BoxliteOptions::default().home_dir);
+            BoxliteRuntime::default_runtime()
+        });
         Ok(Self {
             runtime: Arc::new(runtime.clone()),
         })
@@ -63,10 +73,13 @@ impl PyBoxlite {
     }
 
     #[staticmethod]
-    fn init_default(options: PyOptions) -> PyResult<()> {
+    fn init_default(py: Python<'_>, options: PyOptions) -> PyResult<()> {
         let core_opts = options.into_core()?;
-        let _ = boxlite::init_logging_for(&core_opts.home_dir);
-        BoxliteRuntime::init_default_runtime(core_opts).map_err(map_err)
+        py.detach(|| {
+            let _ = boxlite::init_logging_for(&core_opts.home_dir);
+            BoxliteRuntime::init_default_runtime(core_opts)
+        })
+        .map_err(map_err)
     }
 
     #[pyo3(signature = (options, name=None))]
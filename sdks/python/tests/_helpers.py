@@ -0,0 +1,18 @@
+"""Assertion helpers shared by test modules.
+
+Kept out of conftest.py, which pytest loads itself and which must not be
+imported as a regular module.
+"""
+
+from __future__ import annotations
+
+
+def assert_contains(text: str, *needles: str) -> None:
+    """Assert every needle occurs in ``text``, reporting all missing ones at once.
+
+    One assertion per output string instead of a chain of ``in`` checks; on
+    failure the message lists every absent needle, not just the first.
+    """
+    __tracebackhide__ = True
+    missing = [needle for needle in needles if needle not in text]
+    assert not missing, f"missing {missing} in {text!r}"
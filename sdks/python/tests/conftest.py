@@ -9,11 +9,39 @@ runtime instance.
 
 from __future__ import annotations
 
+import importlib
+import os
+
 import pytest
 
 import boxlite
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked slow (network-bound package installs and the like)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip ``slow`` tests unless --run-slow is given, whatever -m selects."""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test; pass --run-slow to run it")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def boxlite_module():
+    """The imported ``boxlite`` package, resolved once for export checks."""
+    return importlib.import_module("boxlite")
+
+
 def _test_registries() -> list:
     """Mirror list, built lazily.
 
@@ -39,18 +67,66 @@ def _test_registries() -> list:
     ]
 
 
+def _worker_home_dir() -> str | None:
+    """Runtime home for this pytest-xdist worker, or None outside xdist.
+
+    The runtime holds an exclusive lock on its home directory, so parallel
+    workers can't share one; each gets ``workers/<id>`` under BOXLITE_HOME
+    (or ~/.boxlite), which also keeps it inside the make target's temp home.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if not worker:
+        return None
+    base = os.environ.get("BOXLITE_HOME") or os.path.expanduser("~/.boxlite")
+    return os.path.join(base, "workers", worker)
+
+
+# Base image shared by most integration tests; pulled once by alpine_image
+_WARM_IMAGE = "alpine:latest"
+
+
 @pytest.fixture(scope="session")
-def shared_runtime():
+async def shared_runtime():
     """Session-scoped async runtime shared across all async tests.
 
     This fixture creates a single Boxlite runtime that is reused across
     the entire test session, avoiding lock contention between tests.
+    Under pytest-xdist there is one such runtime per worker.
+
+    No image is pulled here; tests booting alpine request ``alpine_image``.
     """
-    rt = boxlite.Boxlite(boxlite.Options(image_registries=_test_registries()))
+    rt = boxlite.Boxlite(
+        boxlite.Options(
+            home_dir=_worker_home_dir(), image_registries=_test_registries()
+        )
+    )
     yield rt
     # Runtime cleanup happens when Python garbage collects the object
 
 
+@pytest.fixture(scope="session")
+async def alpine_image(shared_runtime):
+    """The warm alpine image, pulled once into ``shared_runtime``.
+
+    Pulled up front so the pull isn't charged to whichever alpine test
+    happens to run first (or repeated by tests that create several boxes at
+    once). Tests that never boot alpine don't request it and skip the pull.
+    """
+    await shared_runtime.images.pull(_WARM_IMAGE)
+    return _WARM_IMAGE
+
+
+@pytest.fixture(scope="session")
+def alpine_options(alpine_image):
+    """Plain ``BoxOptions`` for the warm image, built once and reused.
+
+    A fixture rather than a module constant: ``BoxOptions`` is native, and
+    test modules are imported even in the unit lane. Tests that need extra
+    options still build their own.
+    """
+    return boxlite.BoxOptions(image=alpine_image)
+
+
 # For sync API tests - only available if greenlet is installed
 try:
     from boxlite import SyncBoxlite
@@ -87,3 +163,64 @@ def shared_sync_runtime(shared_runtime):
     rt.start()  # Start greenlet machinery
     yield rt
     rt.stop()  # Stop greenlet machinery (doesn't close the shared runtime)
+
+
+@pytest.fixture(scope="module")
+def shared_sync_codebox(shared_sync_runtime):
+    """Module-scoped SyncCodeBox on the shared sync runtime.
+
+    ``run()`` keeps no interpreter state between calls, so tests that only
+    run code can share one box instead of booting a VM each.
+    """
+    from boxlite import SyncCodeBox
+
+    with SyncCodeBox(runtime=shared_sync_runtime) as box:
+        yield box
+
+
+@pytest.fixture(scope="module")
+def shared_sync_simplebox(shared_sync_runtime, alpine_image):
+    """Module-scoped alpine SyncSimpleBox on the shared sync runtime.
+
+    The sync counterpart of ``shared_simplebox``, with the same rule: only for
+    tests that run commands without changing the box.
+    """
+    from boxlite import SyncSimpleBox
+
+    with SyncSimpleBox(image=alpine_image, runtime=shared_sync_runtime) as box:
+        yield box
+
+
+@pytest.fixture(scope="module")
+async def shared_simplebox(shared_runtime, alpine_image):
+    """Module-scoped alpine SimpleBox on the shared async runtime.
+
+    For tests that only run commands and read the results; anything that
+    changes the box itself (files, box-level env, resources) should boot
+    its own.
+    """
+    async with boxlite.SimpleBox(image=alpine_image, runtime=shared_runtime) as box:
+        yield box
+
+
+@pytest.fixture
+def dispatcher_runtime():
+    """SyncBoxlite running only its dispatcher, with no native runtime behind it.
+
+    For unit tests of the greenlet bridge and the sync wrappers, fed with
+    fake async objects instead of VMs.
+    """
+    if not SYNC_AVAILABLE:
+        pytest.skip("greenlet not installed")
+
+    rt = object.__new__(SyncBoxlite)
+    rt._boxlite = None
+    rt._loop = None
+    rt._dispatcher_fiber = None
+    rt._own_loop = False
+    rt._sync_helper = None
+    rt._started = False
+
+    rt.start()
+    yield rt
+    rt.stop()
@@ -18,7 +18,7 @@ import boxlite
 
 logger = logging.getLogger(__name__)
 
-pytestmark = [pytest.mark.integration, pytest.mark.asyncio]
+pytestmark = pytest.mark.integration
 
 
 class RuntimeHarness:
@@ -49,6 +49,12 @@ class RuntimeHarness:
         self._boxes.append(box)
         return box
 
+    async def create_boxes(self, count: int, **kwargs):
+        """Create ``count`` boxes concurrently."""
+        return list(
+            await asyncio.gather(*(self.create_box(**kwargs) for _ in range(count)))
+        )
+
     async def list(self):
         return await self._runtime.list_info()
 
@@ -121,7 +127,7 @@ class TestBoxManagement:
         assert info.memory_mib == 1024
 
     async def test_list_boxes(self, runtime):
-        boxes = [await runtime.create_box() for _ in range(3)]
+        boxes = await runtime.create_boxes(3)
         infos = await runtime.list()
         assert len(infos) >= len(boxes)
         ids = {info.id for info in infos}
@@ -129,7 +135,7 @@ class TestBoxManagement:
             assert box.id in ids
 
     async def test_list_running(self, runtime):
-        boxes = [await runtime.create_box() for _ in range(2)]
+        boxes = await runtime.create_boxes(2)
         running = await runtime.list()
         ids = {box.id for box in boxes}
         # Boxes may be in configured or running state
@@ -227,7 +233,7 @@ class TestBoxManagement:
         assert isinstance(info.memory_mib, int)
 
     async def test_multiple_boxes_isolated(self, runtime):
-        boxes = [await runtime.create_box() for _ in range(5)]
+        boxes = await runtime.create_boxes(5)
         ids = {box.id for box in boxes}
         infos = await runtime.list()
         listed_ids = {info.id for info in infos}
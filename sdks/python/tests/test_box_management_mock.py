@@ -13,12 +13,10 @@ import pytest
 import boxlite
 
 # Native extension types are only available when the Rust extension is compiled.
-# In CI unit-test jobs the extension is not built, so skip gracefully.
-_NATIVE_AVAILABLE = hasattr(boxlite, "Boxlite")
-
-pytestmark = pytest.mark.skipif(
-    not _NATIVE_AVAILABLE, reason="native Rust extension not available"
-)
+# In CI unit-test jobs the extension is not built, so skip the whole module at
+# collection time rather than collecting every test just to skip it.
+if not hasattr(boxlite, "Boxlite"):
+    pytest.skip("native Rust extension not available", allow_module_level=True)
 
 
 class TestExports:
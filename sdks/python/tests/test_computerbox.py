@@ -0,0 +1,243 @@
+"""Unit tests for ComputerBox's persistent command session (no VM required).
+
+The guest shell is stood in for by a local ``sh`` subprocess.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+
+import pytest
+import pytest_asyncio
+
+from boxlite.computerbox import _SCREENSHOT_SCRIPT, ComputerBox
+
+pytestmark = pytest.mark.skipif(shutil.which("sh") is None, reason="needs sh")
+
+
+class _ProcStdin:
+    def __init__(self, proc) -> None:
+        self._proc = proc
+
+    async def send_input(self, data: bytes) -> None:
+        self._proc.stdin.write(data)
+        await self._proc.stdin.drain()
+
+    async def close(self) -> None:
+        self._proc.stdin.close()
+
+
+class _ProcStream:
+    def __init__(self, stream) -> None:
+        self._stream = stream
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> str:
+        # Small reads so framing has to cope with split markers.
+        data = await self._stream.read(7)
+        if not data:
+            raise StopAsyncIteration
+        return data.decode()
+
+
+class _ProcExecution:
+    def __init__(self, proc) -> None:
+        self.proc = proc
+        self.kills = 0
+
+    def stdin(self):
+        return _ProcStdin(self.proc)
+
+    def stdout(self):
+        return _ProcStream(self.proc.stdout)
+
+    def stderr(self):
+        return _ProcStream(self.proc.stderr)
+
+    async def kill(self) -> None:
+        self.kills += 1
+        if self.proc.returncode is None:
+            self.proc.kill()
+
+
+class _ShellBox:
+    def __init__(self) -> None:
+        self.executions: list[_ProcExecution] = []
+
+    async def exec(self, cmd, args=None, **kwargs):
+        proc = await asyncio.create_subprocess_exec(
+            cmd,
+            *(args or []),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        execution = _ProcExecution(proc)
+        self.executions.append(execution)
+        return execution
+
+
+@pytest_asyncio.fixture
+async def computer():
+    box = ComputerBox.__new__(ComputerBox)
+    box._started = True
+    box._box = _ShellBox()
+    box._command_timeout = 5
+    box._session = None
+    box._session_lock = asyncio.Lock()
+    yield box
+    for execution in box._box.executions:
+        if execution.proc.returncode is None:
+            execution.proc.kill()
+            await execution.proc.wait()
+
+
+async def test_session_is_reused_across_commands(computer):
+    first = await computer._run("echo", "first")
+    second = await computer._run("printf", "%s", "no newline")
+
+    assert first.exit_code == 0
+    assert first.stdout == "first\n"
+    assert second.stdout == "no newline"
+    assert len(computer._box.executions) == 1
+
+
+async def test_session_reports_failures_with_output(computer):
+    result = await computer._run("sh", "-c", "echo out; echo boom >&2; exit 3")
+
+    assert result.exit_code == 3
+    assert result.stdout == "out\n"
+    assert result.stderr == "boom\n"
+    assert (await computer._run("true")).exit_code == 0
+
+
+async def test_session_keeps_stderr_out_of_stdout(computer):
+    result = await computer._run("sh", "-c", "echo warning >&2; printf payload")
+
+    assert result.exit_code == 0
+    assert result.stdout == "payload"
+    assert result.stderr == "warning\n"
+
+
+async def test_session_is_replaced_after_a_command_times_out(computer):
+    from boxlite.errors import TimeoutError
+
+    computer._command_timeout = 0.2
+    with pytest.raises(TimeoutError):
+        # exec, so killing the session's shell kills the sleep too
+        await computer._run("exec", "sleep", "30")
+    assert computer._session is None
+    # The hung shell was killed, once, not left running
+    await asyncio.wait_for(computer._box.executions[0].proc.wait(), 5)
+    assert computer._box.executions[0].kills == 1
+
+    computer._command_timeout = 5
+    result = await computer._run("echo", "again")
+    assert result.stdout == "again\n"
+    assert len(computer._box.executions) == 2
+
+
+async def test_command_reading_stdin_does_not_swallow_later_commands(computer):
+    result = await computer._run("cat")
+    following = await computer._run("echo", "next")
+
+    assert result.stdout == ""
+    assert following.stdout == "next\n"
+    assert len(computer._box.executions) == 1
+
+
+async def test_session_quotes_arguments(computer):
+    text = "it's a\nmulti-line $HOME `string`"
+
+    result = await computer._run("printf", "%s", text)
+
+    assert result.stdout == text
+
+
+async def test_session_is_reopened_after_it_dies(computer):
+    await computer._run("true")
+    computer._box.executions[0].proc.kill()
+
+    with pytest.raises(ConnectionError):
+        await computer._run("echo", "lost")
+
+    result = await computer._run("echo", "again")
+    assert result.stdout == "again\n"
+    assert len(computer._box.executions) == 2
+
+
+async def test_run_requires_started_box():
+    box = ComputerBox.__new__(ComputerBox)
+    box._started = False
+
+    with pytest.raises(RuntimeError, match="Box not started"):
+        await box._run("true")
+
+
+async def test_wait_until_ready_probes_before_listing_windows(monkeypatch):
+    from boxlite import constants as const
+    from boxlite.exec import ExecResult
+
+    monkeypatch.setattr(const, "DESKTOP_READY_RETRY_DELAY", 0)
+    size = f"{const.COMPUTERBOX_DISPLAY_WIDTH}x{const.COMPUTERBOX_DISPLAY_HEIGHT}"
+    replies = {
+        "pgrep": [ExecResult(1, "", ""), ExecResult(0, "42\n", "")],
+        "xwininfo": [ExecResult(0, f'"xfdesktop": {size}+0+0\n', "")],
+    }
+    calls = []
+
+    async def fake_run(*argv):
+        calls.append(argv[0])
+        return replies[argv[0]].pop(0)
+
+    box = ComputerBox.__new__(ComputerBox)
+    box._width = const.COMPUTERBOX_DISPLAY_WIDTH
+    box._height = const.COMPUTERBOX_DISPLAY_HEIGHT
+    monkeypatch.setattr(box, "_run", fake_run)
+
+    await box.wait_until_ready(timeout=5)
+
+    assert calls == ["pgrep", "pgrep", "xwininfo"]
+
+
+async def test_screenshot_uses_script_specialised_for_geometry(monkeypatch):
+    from boxlite.exec import ExecResult
+
+    box = ComputerBox.__new__(ComputerBox)
+    box._width, box._height = 640, 480
+    box._screenshot_src = _SCREENSHOT_SCRIPT.format(width=640, height=480)
+    scripts = []
+
+    async def fake_run(*argv):
+        scripts.append(argv[-1])
+        return ExecResult(0, "aGVsbG8=\n", "")
+
+    monkeypatch.setattr(box, "_run", fake_run)
+
+    shot = await box.screenshot()
+
+    assert "bbox=(0, 0, 640, 480)" in scripts[0]
+    assert shot == {"data": "aGVsbG8=", "width": 640, "height": 480, "format": "png"}
+
+
+def test_display_size_follows_user_env_override(monkeypatch):
+    from boxlite.simplebox import SimpleBox
+
+    monkeypatch.setattr(SimpleBox, "__init__", lambda self, **kwargs: None)
+
+    box = ComputerBox(env=[("DISPLAY_SIZEW", "1280"), ("DISPLAY_SIZEH", "800")])
+
+    assert (box._width, box._height) == (1280, 800)
+    assert "bbox=(0, 0, 1280, 800)" in box._screenshot_src
+
+
+def test_non_integer_display_size_override_is_rejected(monkeypatch):
+    from boxlite.simplebox import SimpleBox
+
+    monkeypatch.setattr(SimpleBox, "__init__", lambda self, **kwargs: None)
+
+    with pytest.raises(ValueError, match="DISPLAY_SIZEW must be an integer"):
+        ComputerBox(env=[("DISPLAY_SIZEW", "wide")])
@@ -10,7 +10,7 @@ import pytest
 
 import boxlite
 
-pytestmark = [pytest.mark.integration, pytest.mark.asyncio]
+pytestmark = pytest.mark.integration
 
 LOCAL_IMAGE = "python:3-alpine"
 LOCAL_PORT = 18081
@@ -4,27 +4,31 @@ Unit tests for ExecResult dataclass (no VM required).
 Tests the ExecResult structure and behavior.
 """
 
-from dataclasses import is_dataclass
+from dataclasses import fields
 
 import pytest
 
 import boxlite
 from boxlite.exec import ExecResult
+from tests._helpers import assert_contains
+
+try:
+    from boxlite.sync_api._execution import SyncExecution
+except ImportError:  # greenlet not installed
+    SyncExecution = None
 
 
 class TestExecResultStructure:
     """Test ExecResult dataclass structure."""
 
-    def test_is_dataclass(self):
-        """Test that ExecResult is a dataclass."""
-        assert is_dataclass(ExecResult)
-
-    def test_has_required_fields(self):
-        """Test that ExecResult has all required fields."""
-        result = ExecResult(exit_code=0, stdout="output", stderr="error")
-        assert hasattr(result, "exit_code")
-        assert hasattr(result, "stdout")
-        assert hasattr(result, "stderr")
+    def test_fields(self):
+        """Test that ExecResult is a dataclass with exactly the expected fields."""
+        assert [f.name for f in fields(ExecResult)] == [
+            "exit_code",
+            "stdout",
+            "stderr",
+            "error_message",
+        ]
 
     def test_field_types(self):
         """Test that ExecResult fields have correct types."""
@@ -33,6 +37,13 @@ class TestExecResultStructure:
         assert isinstance(result.stdout, str)
         assert isinstance(result.stderr, str)
 
+    def test_is_mutable_and_slotted(self):
+        """Test that ExecResult fields stay assignable with no instance __dict__."""
+        result = ExecResult(exit_code=0, stdout="out", stderr="err")
+        result.exit_code = 1
+        assert result.exit_code == 1
+        assert not hasattr(result, "__dict__")
+
 
 class TestExecResultCreation:
     """Test ExecResult creation."""
@@ -106,10 +117,7 @@ class TestExecResultRepresentation:
     def test_repr(self):
         """Test that ExecResult has a useful repr."""
         result = ExecResult(exit_code=0, stdout="output", stderr="")
-        repr_str = repr(result)
-        assert "ExecResult" in repr_str
-        assert "exit_code=0" in repr_str
-        assert "stdout='output'" in repr_str
+        assert_contains(repr(result), "ExecResult", "exit_code=0", "stdout='output'")
 
 
 class TestExecResultUsage:
@@ -128,9 +136,9 @@ class TestExecResultUsage:
         result = ExecResult(
             exit_code=0, stdout="standard output\n", stderr="error output\n"
         )
-        combined = result.stdout + result.stderr
-        assert "standard output" in combined
-        assert "error output" in combined
+        assert_contains(
+            result.stdout + result.stderr, "standard output", "error output"
+        )
 
     def test_empty_result(self):
         """Test result with no output."""
@@ -148,11 +156,6 @@ class TestExecResultUsage:
 class TestExecResultExports:
     """Test that ExecResult is properly exported."""
 
-    def test_in_boxlite_module(self):
-        """Test that ExecResult is exported from boxlite."""
-        assert hasattr(boxlite, "ExecResult")
-        assert boxlite.ExecResult is ExecResult
-
     def test_from_exec_module(self):
         """Test that ExecResult can be imported from exec module."""
         from boxlite.exec import ExecResult as ER
@@ -201,36 +204,22 @@ class TestExecutionAPIExports:
         assert hasattr(boxlite.Execution, "stderr")
 
 
+@pytest.mark.skipif(SyncExecution is None, reason="sync API not available")
 class TestSyncExecutionAPIExports:
     """Test that SyncExecution class exposes expected methods."""
 
     def test_sync_execution_has_resize_tty(self):
         """Test that SyncExecution class has resize_tty method."""
-        try:
-            from boxlite.sync_api._execution import SyncExecution
-
-            assert hasattr(SyncExecution, "resize_tty")
-            assert callable(SyncExecution.resize_tty)
-        except ImportError:
-            pytest.skip("sync API not available")
+        assert hasattr(SyncExecution, "resize_tty")
+        assert callable(SyncExecution.resize_tty)
 
     def test_sync_execution_has_kill(self):
         """Test that SyncExecution class has kill method."""
-        try:
-            from boxlite.sync_api._execution import SyncExecution
-
-            assert hasattr(SyncExecution, "kill")
-        except ImportError:
-            pytest.skip("sync API not available")
+        assert hasattr(SyncExecution, "kill")
 
     def test_sync_execution_has_wait(self):
         """Test that SyncExecution class has wait method."""
-        try:
-            from boxlite.sync_api._execution import SyncExecution
-
-            assert hasattr(SyncExecution, "wait")
-        except ImportError:
-            pytest.skip("sync API not available")
+        assert hasattr(SyncExecution, "wait")
 
 
 if __name__ == "__main__":
@@ -26,7 +26,7 @@ import pytest
 
 import boxlite
 
-pytestmark = [pytest.mark.integration, pytest.mark.asyncio]
+pytestmark = pytest.mark.integration
 
 # Workload: install SIG_IGN for SIGALRM, then sleep WORKLOAD_S seconds.
 # If the timeout watcher fires SIGALRM, the workload absorbs it and the
@@ -0,0 +1,46 @@
+"""
+Unit tests for the top-level ``boxlite`` exports (no VM required).
+
+Covers the pure-Python API, which is exported whether or not the native
+extension is built.
+"""
+
+import importlib
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    ("name", "module"),
+    [
+        ("SimpleBox", "boxlite.simplebox"),
+        ("CodeBox", "boxlite.codebox"),
+        ("ExecResult", "boxlite.exec"),
+        ("BoxliteError", "boxlite.errors"),
+        ("ExecError", "boxlite.errors"),
+        ("TimeoutError", "boxlite.errors"),
+        ("ParseError", "boxlite.errors"),
+    ],
+)
+def test_exported_from_boxlite(boxlite_module, name, module):
+    """Test that each name is exported as the object its module defines."""
+    assert name in boxlite_module.__all__
+    assert getattr(boxlite_module, name) is getattr(
+        importlib.import_module(module), name
+    )
+
+
+@pytest.mark.parametrize(
+    ("name", "module"),
+    [
+        ("SyncSimpleBox", "boxlite.sync_api._simplebox"),
+        ("SyncCodeBox", "boxlite.sync_api._codebox"),
+    ],
+)
+def test_sync_exported_from_boxlite(boxlite_module, name, module):
+    """Test that the sync convenience boxes are exported when greenlet is present."""
+    pytest.importorskip("greenlet")
+    assert name in boxlite_module.__all__
+    assert getattr(boxlite_module, name) is getattr(
+        importlib.import_module(module), name
+    )
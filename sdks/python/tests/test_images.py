@@ -8,7 +8,7 @@ import pytest
 
 import boxlite
 
-pytestmark = [pytest.mark.integration, pytest.mark.asyncio]
+pytestmark = pytest.mark.integration
 
 
 async def test_images_pull_returns_metadata(shared_runtime: boxlite.Boxlite):
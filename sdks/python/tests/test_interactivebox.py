@@ -0,0 +1,162 @@
+"""Unit tests for InteractiveBox I/O forwarding and shutdown (no VM required)."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+
+import pytest
+
+from boxlite import interactivebox
+from boxlite.interactivebox import InteractiveBox, _pump
+
+
+class _FakeStdin:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeBox:
+    def __init__(self) -> None:
+        self.exited = False
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.exited = True
+
+
+def _interactive_box(io_task) -> InteractiveBox:
+    box = InteractiveBox.__new__(InteractiveBox)
+    box._box = _FakeBox()
+    box._old_tty_settings = None
+    box._error_message = None
+    box._exited = asyncio.Event()
+    box._stdin = _FakeStdin()
+    box._io_task = io_task
+    return box
+
+
+async def test_aexit_signals_forwarders_before_waiting():
+    box = None
+
+    async def forwarder():
+        await box._exited.wait()
+
+    box = _interactive_box(asyncio.ensure_future(forwarder()))
+
+    await asyncio.wait_for(box.__aexit__(None, None, None), timeout=1)
+
+    assert box._stdin.closed
+    assert box._io_task is None
+    assert box._box.exited
+
+
+async def test_aexit_cancels_stuck_io_task(monkeypatch):
+    monkeypatch.setattr(interactivebox, "_IO_DRAIN_TIMEOUT", 0.1)
+    stuck = asyncio.ensure_future(asyncio.Event().wait())
+    box = _interactive_box(stuck)
+
+    await asyncio.wait_for(box.__aexit__(None, None, None), timeout=1)
+
+    assert stuck.cancelled()
+    assert box._box.exited
+
+
+async def test_aexit_delivers_output_written_just_before_exit():
+    """Output the shell flushes as it winds down still reaches the terminal."""
+    box = None
+
+    class _ExitBanner:
+        def __init__(self) -> None:
+            self._sent = False
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            if self._sent:
+                raise StopAsyncIteration
+            # The shell only prints its last line once stdin is closed, and
+            # takes a moment to do so.
+            while not box._stdin.closed:
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.5)
+            self._sent = True
+            return "logout\n"
+
+    read_fd, write_fd = os.pipe()
+    try:
+        box = _interactive_box(
+            asyncio.gather(_pump(_ExitBanner(), write_fd), return_exceptions=True)
+        )
+        await asyncio.wait_for(box.__aexit__(None, None, None), timeout=5)
+        os.close(write_fd)
+        write_fd = None
+        data = _read_pipe(read_fd)
+    finally:
+        os.close(read_fd)
+        if write_fd is not None:
+            os.close(write_fd)
+
+    assert data == b"logout\n"
+    assert box._box.exited
+
+
+class _ChunkStream:
+    def __init__(self, chunks: list, error: Exception | None = None) -> None:
+        self._chunks = list(chunks)
+        self._error = error
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._chunks:
+            return self._chunks.pop(0)
+        if self._error is not None:
+            raise self._error
+        raise StopAsyncIteration
+
+
+def _read_pipe(read_fd: int) -> bytes:
+    data = b""
+    while chunk := os.read(read_fd, 65536):
+        data += chunk
+    return data
+
+
+async def test_pump_forwards_all_chunks_in_order():
+    chunks = [f"line {i}\n" for i in range(200)] + [b"raw bytes\n"]
+    read_fd, write_fd = os.pipe()
+    try:
+        await _pump(_ChunkStream(chunks), write_fd)
+        os.close(write_fd)
+        write_fd = None
+        data = _read_pipe(read_fd)
+    finally:
+        os.close(read_fd)
+        if write_fd is not None:
+            os.close(write_fd)
+
+    expected = "".join(f"line {i}\n" for i in range(200)) + "raw bytes\n"
+    assert data == expected.encode()
+
+
+async def test_pump_flushes_output_before_raising_stream_error():
+    read_fd, write_fd = os.pipe()
+    try:
+        with pytest.raises(RuntimeError, match="stream broke"):
+            await _pump(
+                _ChunkStream(["partial"], RuntimeError("stream broke")), write_fd
+            )
+        os.close(write_fd)
+        write_fd = None
+        data = _read_pipe(read_fd)
+    finally:
+        os.close(read_fd)
+        if write_fd is not None:
+            os.close(write_fd)
+
+    assert data == b"partial"
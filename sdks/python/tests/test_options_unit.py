@@ -0,0 +1,149 @@
+"""
+Unit tests for BoxOptions construction (no VM required).
+
+Covers default and explicit values for the lifecycle, capability, cmd/user
+and entrypoint options. The behavior these options drive is covered by the
+integration tests in test_options.py.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+import boxlite
+
+# BoxOptions is a native pyclass; the CI unit job runs without the extension.
+if not hasattr(boxlite, "BoxOptions"):
+    pytest.skip("native Rust extension not available", allow_module_level=True)
+
+
+class TestBoxOptionsDefaults:
+    """Test BoxOptions default values."""
+
+    def test_auto_remove_default_is_none(self):
+        """Test that auto_remove defaults to None (uses Rust default)."""
+        opts = boxlite.BoxOptions()
+        # Python side defaults to None, Rust side defaults to True
+        assert opts.auto_remove is None
+
+    def test_detach_default_is_none(self):
+        """Test that detach defaults to None (uses Rust default)."""
+        opts = boxlite.BoxOptions()
+        # Python side defaults to None, Rust side defaults to False
+        assert opts.detach is None
+
+    def test_capability_lists_default_to_empty(self):
+        """Test that capability overrides are empty under advanced options."""
+        advanced = boxlite.AdvancedBoxOptions()
+        assert advanced.capabilities.add == []
+        assert advanced.capabilities.drop == []
+
+    def test_custom_capability_lists_are_preserved(self):
+        """Test supplying Docker-style capability additions and removals."""
+        capabilities = boxlite.ContainerCapabilities(
+            add=["NET_ADMIN", "SYS_PTRACE"],
+            drop=["MKNOD", "NET_RAW"],
+        )
+        opts = boxlite.BoxOptions(
+            image="alpine:latest",
+            advanced=boxlite.AdvancedBoxOptions(capabilities=capabilities),
+        )
+        assert opts.advanced.capabilities.add == ["NET_ADMIN", "SYS_PTRACE"]
+        assert opts.advanced.capabilities.drop == ["MKNOD", "NET_RAW"]
+        assert not hasattr(opts, "cap_add")
+        assert not hasattr(opts, "cap_drop")
+
+    def test_explicit_auto_remove_true(self):
+        """Test setting auto_remove=True explicitly."""
+        opts = boxlite.BoxOptions(image="alpine:latest", auto_remove=True)
+        assert opts.auto_remove is True
+
+    def test_explicit_auto_remove_false(self):
+        """Test setting auto_remove=False explicitly."""
+        opts = boxlite.BoxOptions(image="alpine:latest", auto_remove=False)
+        assert opts.auto_remove is False
+
+    def test_explicit_detach_true(self):
+        """Test setting detach=True explicitly."""
+        opts = boxlite.BoxOptions(image="alpine:latest", detach=True)
+        assert opts.detach is True
+
+    def test_explicit_detach_false(self):
+        """Test setting detach=False explicitly."""
+        opts = boxlite.BoxOptions(image="alpine:latest", detach=False)
+        assert opts.detach is False
+
+
+class TestCmdAndUserOptions:
+    """Test cmd and user override options."""
+
+    def test_cmd_default_is_none(self):
+        """Test that cmd defaults to None."""
+        opts = boxlite.BoxOptions()
+        assert opts.cmd is None
+
+    def test_user_default_is_none(self):
+        """Test that user defaults to None."""
+        opts = boxlite.BoxOptions()
+        assert opts.user is None
+
+    def test_cmd_explicit_value(self):
+        """Test setting cmd with a single argument."""
+        opts = boxlite.BoxOptions(image="alpine:latest", cmd=["--flag"])
+        assert opts.cmd == ["--flag"]
+
+    def test_user_explicit_value(self):
+        """Test setting user with uid:gid format."""
+        opts = boxlite.BoxOptions(image="alpine:latest", user="1000:1000")
+        assert opts.user == "1000:1000"
+
+    def test_cmd_multiple_args(self):
+        """Test cmd with multiple arguments."""
+        opts = boxlite.BoxOptions(
+            image="docker:dind", cmd=["--iptables=false", "--storage-driver=overlay2"]
+        )
+        assert opts.cmd == ["--iptables=false", "--storage-driver=overlay2"]
+
+    def test_cmd_empty_list(self):
+        """Test cmd with empty list (explicit override to no args)."""
+        opts = boxlite.BoxOptions(image="alpine:latest", cmd=[])
+        assert opts.cmd == []
+
+    def test_user_uid_only(self):
+        """Test user with uid only (no gid)."""
+        opts = boxlite.BoxOptions(image="alpine:latest", user="1000")
+        assert opts.user == "1000"
+
+    def test_user_username(self):
+        """Test user with username string."""
+        opts = boxlite.BoxOptions(image="alpine:latest", user="nginx")
+        assert opts.user == "nginx"
+
+
+class TestEntrypointOptions:
+    """Test entrypoint override options."""
+
+    def test_entrypoint_default_is_none(self):
+        """Test that entrypoint defaults to None."""
+        opts = boxlite.BoxOptions()
+        assert opts.entrypoint is None
+
+    def test_entrypoint_explicit_value(self):
+        """Test setting entrypoint with a single binary."""
+        opts = boxlite.BoxOptions(image="docker:dind", entrypoint=["dockerd"])
+        assert opts.entrypoint == ["dockerd"]
+
+    def test_entrypoint_with_cmd(self):
+        """Test setting both entrypoint and cmd."""
+        opts = boxlite.BoxOptions(
+            image="docker:dind",
+            entrypoint=["dockerd"],
+            cmd=["--iptables=false"],
+        )
+        assert opts.entrypoint == ["dockerd"]
+        assert opts.cmd == ["--iptables=false"]
+
+    def test_entrypoint_empty_list(self):
+        """Test entrypoint with empty list (explicit override to no entrypoint)."""
+        opts = boxlite.BoxOptions(image="alpine:latest", entrypoint=[])
+        assert opts.entrypoint == []
@@ -31,7 +31,7 @@ ATTACK_PAYLOAD = "modified content"
 
 
 @pytest.fixture
-def runtime(shared_sync_runtime):
+def runtime(shared_sync_runtime, alpine_image):
     """Reuse the shared sync runtime (one runtime per ~/.boxlite flock)."""
     return shared_sync_runtime
 
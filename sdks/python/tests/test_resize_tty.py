@@ -11,7 +11,7 @@ import pytest
 
 import boxlite
 
-pytestmark = pytest.mark.integration
+pytestmark = [pytest.mark.integration, pytest.mark.usefixtures("alpine_image")]
 
 
 class TestResizeTtySync:
@@ -160,7 +160,7 @@ class TestBoxOptionsWithSecrets:
 
 
 @pytest.fixture
-def runtime(shared_sync_runtime):
+def runtime(shared_sync_runtime, alpine_image):
     """Use shared sync runtime."""
     return shared_sync_runtime
 
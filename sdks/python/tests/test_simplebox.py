@@ -2,24 +2,34 @@
 
 from __future__ import annotations
 
-import pytest
+import asyncio
 
-import boxlite
+import pytest
 
-pytestmark = [pytest.mark.integration, pytest.mark.asyncio]
+# Keep the module on one xdist worker so shared_simplebox boots once
+pytestmark = [pytest.mark.integration, pytest.mark.xdist_group("simplebox")]
 
 
-async def test_simplebox_metrics(shared_runtime):
+async def test_simplebox_metrics(shared_simplebox):
     """Async SimpleBox exposes box metrics like SyncSimpleBox."""
-    async with boxlite.SimpleBox(image="alpine:latest", runtime=shared_runtime) as box:
-        await box.exec("echo", "test")
-        metrics = await box.metrics()
-        assert metrics is not None
-        assert metrics.commands_executed_total >= 1
+    await shared_simplebox.exec("echo", "test")
+    metrics = await shared_simplebox.metrics()
+    assert metrics is not None
+    assert metrics.commands_executed_total >= 1
+
+
+async def test_simplebox_concurrent_execs(shared_simplebox):
+    """Independent exec() calls on one box can be awaited together."""
+    results = await asyncio.gather(
+        shared_simplebox.exec("echo", "first"),
+        shared_simplebox.exec("echo", "second"),
+        shared_simplebox.exec("echo", "third"),
+    )
+    assert [r.stdout for r in results] == ["first\n", "second\n", "third\n"]
+    assert all(r.exit_code == 0 for r in results)
 
 
-async def test_simplebox_info_is_awaitable(shared_runtime):
+async def test_simplebox_info_is_awaitable(shared_simplebox):
     """Async SimpleBox resolves box metadata through its native handle."""
-    async with boxlite.SimpleBox(image="alpine:latest", runtime=shared_runtime) as box:
-        info = await box.info()
-        assert info.id == box.id
+    info = await shared_simplebox.info()
+    assert info.id == shared_simplebox.id
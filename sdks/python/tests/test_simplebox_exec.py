@@ -0,0 +1,128 @@
+"""Unit tests for SimpleBox.exec output collection (no VM required)."""
+
+from __future__ import annotations
+
+import asyncio
+
+from boxlite.simplebox import SimpleBox
+
+
+class _FakeStream:
+    def __init__(self, chunks: list) -> None:
+        self._chunks = list(chunks)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._chunks:
+            raise StopAsyncIteration
+        return self._chunks.pop(0)
+
+
+class _FakeWaitResult:
+    def __init__(self, exit_code: int, error_message: str | None = None) -> None:
+        self.exit_code = exit_code
+        self.error_message = error_message
+
+
+class _FakeExecution:
+    def __init__(self, stdout: list, stderr: list, exit_code: int = 0) -> None:
+        self._stdout = _FakeStream(stdout)
+        self._stderr = _FakeStream(stderr)
+        self._exit_code = exit_code
+
+    def stdout(self):
+        return self._stdout
+
+    def stderr(self):
+        return self._stderr
+
+    async def wait(self):
+        return _FakeWaitResult(self._exit_code)
+
+
+class _FakeExecBox:
+    def __init__(self, execution: _FakeExecution) -> None:
+        self.execution = execution
+        self.calls: list[tuple] = []
+
+    async def exec(self, cmd, args, env, **kwargs):
+        self.calls.append((cmd, args, env, kwargs))
+        return self.execution
+
+
+def _started_box(execution: _FakeExecution) -> SimpleBox:
+    box = SimpleBox.__new__(SimpleBox)
+    box._started = True
+    box._box = _FakeExecBox(execution)
+    return box
+
+
+async def test_exec_joins_str_chunks():
+    box = _started_box(_FakeExecution(["a\n", "b\n"], ["warn\n"], exit_code=3))
+
+    result = await box.exec("sh", "-c", "true")
+
+    assert result.stdout == "a\nb\n"
+    assert result.stderr == "warn\n"
+    assert result.exit_code == 3
+
+
+async def test_exec_decodes_byte_chunks_once():
+    encoded = "héllo 世界\n".encode()
+    # Split inside multi-byte sequences: per-chunk decoding would mangle these.
+    chunks = [encoded[:2], encoded[2:9], encoded[9:]]
+    box = _started_box(_FakeExecution(chunks, [b"\xff"]))
+
+    result = await box.exec("cat")
+
+    assert result.stdout == "héllo 世界\n"
+    assert result.stderr == "�"
+
+
+async def test_exec_with_no_output():
+    box = _started_box(_FakeExecution([], []))
+
+    result = await box.exec("true")
+
+    assert result.stdout == ""
+    assert result.stderr == ""
+    assert result.exit_code == 0
+
+
+class _GatedStream:
+    """Yields one chunk only after ``gate`` is set, then sets ``signal``."""
+
+    def __init__(self, chunk, gate, signal) -> None:
+        self._chunk = chunk
+        self._gate = gate
+        self._signal = signal
+        self._done = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._done:
+            raise StopAsyncIteration
+        self._signal.set()
+        await self._gate.wait()
+        self._done = True
+        return self._chunk
+
+
+async def test_exec_drains_stdout_and_stderr_concurrently():
+    # Each stream blocks until the other has started producing; draining
+    # them one after the other would never finish.
+    stdout_started = asyncio.Event()
+    stderr_started = asyncio.Event()
+    execution = _FakeExecution([], [])
+    execution._stdout = _GatedStream("out", stderr_started, stdout_started)
+    execution._stderr = _GatedStream("err", stdout_started, stderr_started)
+    box = _started_box(execution)
+
+    result = await asyncio.wait_for(box.exec("sh"), timeout=5)
+
+    assert result.stdout == "out"
+    assert result.stderr == "err"
@@ -0,0 +1,112 @@
+"""Unit tests for SimpleBox/SyncSimpleBox default-runtime resolution (no VM required)."""
+
+from __future__ import annotations
+
+import pytest
+
+from boxlite import simplebox
+from boxlite.simplebox import SimpleBox
+
+
+class _FakeBoxlite:
+    calls = 0
+
+    @classmethod
+    def default(cls):
+        cls.calls += 1
+        return cls()
+
+
+@pytest.fixture
+def fake_native(monkeypatch):
+    _FakeBoxlite.calls = 0
+    monkeypatch.setattr(simplebox, "_native_import_error", None)
+    monkeypatch.setattr(simplebox, "Boxlite", _FakeBoxlite)
+    monkeypatch.setattr(simplebox, "BoxOptions", lambda **kwargs: kwargs)
+    monkeypatch.setattr(simplebox, "_default_runtime_handle", None)
+
+
+def test_boxes_share_the_default_runtime_handle(fake_native):
+    first = SimpleBox(image="alpine:latest")
+    second = SimpleBox(image="alpine:latest")
+
+    assert first._runtime is second._runtime
+    assert _FakeBoxlite.calls == 1
+
+
+def test_explicit_runtime_bypasses_the_default(fake_native):
+    runtime = object()
+
+    box = SimpleBox(image="alpine:latest", runtime=runtime)
+
+    assert box._runtime is runtime
+    assert _FakeBoxlite.calls == 0
+
+
+class _FakeSyncBox:
+    def stop(self) -> None:
+        pass
+
+
+class _FakeSyncBoxlite:
+    started = 0
+    stopped = 0
+
+    @classmethod
+    def default(cls):
+        return cls()
+
+    def start(self):
+        type(self).started += 1
+        return self
+
+    def stop(self) -> None:
+        type(self).stopped += 1
+
+    def create(self, options, name=None):
+        return _FakeSyncBox()
+
+
+@pytest.fixture
+def shared_sync_default(monkeypatch):
+    pytest.importorskip("greenlet")
+    from boxlite.sync_api import _simplebox
+
+    _FakeSyncBoxlite.started = _FakeSyncBoxlite.stopped = 0
+    monkeypatch.setattr(_simplebox, "_SHARE_DEFAULT_RUNTIME", True)
+    monkeypatch.setattr(_simplebox, "_BoxOptions", lambda **kwargs: kwargs)
+    monkeypatch.setattr(_simplebox, "SyncBoxlite", _FakeSyncBoxlite)
+    return _simplebox.SyncSimpleBox
+
+
+def test_sync_boxes_share_one_started_default_runtime(shared_sync_default):
+    with shared_sync_default(image="alpine:latest") as outer:
+        with shared_sync_default(image="alpine:latest") as inner:
+            assert inner._runtime is outer._runtime
+        assert _FakeSyncBoxlite.stopped == 0
+
+    assert (_FakeSyncBoxlite.started, _FakeSyncBoxlite.stopped) == (1, 1)
+
+    with shared_sync_default(image="alpine:latest"):
+        pass
+
+    assert (_FakeSyncBoxlite.started, _FakeSyncBoxlite.stopped) == (2, 2)
+
+
+def test_sync_box_create_failure_releases_shared_runtime(
+    shared_sync_default, monkeypatch
+):
+    from boxlite.sync_api import _simplebox
+
+    def fail_create(self, options, name=None):
+        raise RuntimeError("image pull failed")
+
+    monkeypatch.setattr(_FakeSyncBoxlite, "create", fail_create)
+
+    box = shared_sync_default(image="alpine:latest")
+    with pytest.raises(RuntimeError, match="image pull failed"):
+        box.__enter__()
+
+    assert (_FakeSyncBoxlite.started, _FakeSyncBoxlite.stopped) == (1, 1)
+    assert _simplebox._shared_default.refs == 0
+    assert _simplebox._shared_default.runtime is None
@@ -102,6 +102,7 @@ class TestSkillBoxSetup:
     """Test SkillBox dependency installation."""
 
     @pytest.mark.slow
+    @pytest.mark.timeout(600)
     def test_is_claude_installed_false_initially(
         self, shared_sync_runtime, oauth_token
     ):
@@ -120,6 +121,7 @@ class TestSkillBoxSetup:
             assert wait_result.exit_code in [0, 1]  # 0 if installed, 1 if not
 
     @pytest.mark.slow
+    @pytest.mark.timeout(600)
     def test_setup_installs_dependencies(self, shared_sync_runtime, oauth_token):
         """Test that setup installs Claude CLI and required dependencies."""
         with SyncSkillBox(
@@ -154,6 +156,7 @@ class TestSkillBoxInstallSkill:
     """Test skill installation functionality."""
 
     @pytest.mark.slow
+    @pytest.mark.timeout(600)
     def test_install_skill_returns_bool(self, shared_sync_runtime, oauth_token):
         """Test that install_skill returns a boolean."""
         with SyncSkillBox(
@@ -166,6 +169,7 @@ class TestSkillBoxInstallSkill:
             assert isinstance(result, bool)
 
     @pytest.mark.slow
+    @pytest.mark.timeout(600)
     def test_install_invalid_skill_returns_false(
         self, shared_sync_runtime, oauth_token
     ):
@@ -190,6 +194,7 @@ class TestSkillBoxCall:
     """
 
     @pytest.mark.slow
+    @pytest.mark.timeout(600)
     @pytest.mark.skip(reason="Requires valid OAuth token and Claude API access")
     def test_call_simple(self, shared_sync_runtime, oauth_token):
         """Test simple call to Claude."""
@@ -202,6 +207,7 @@ class TestSkillBoxCall:
             assert len(result) > 0
 
     @pytest.mark.slow
+    @pytest.mark.timeout(600)
     @pytest.mark.skip(reason="Requires valid OAuth token and Claude API access")
     def test_call_multi_turn(self, shared_sync_runtime, oauth_token):
         """Test multi-turn conversation - Claude remembers context."""
@@ -24,7 +24,7 @@ import pytest
 
 import boxlite
 
-pytestmark = [pytest.mark.integration, pytest.mark.asyncio]
+pytestmark = pytest.mark.integration
 
 # ── Reporter's PoC constants ──────────────────────────────────────────────────
 
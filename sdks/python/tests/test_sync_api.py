@@ -7,6 +7,7 @@ remains async-only. The tests launch real VMs, so we mark them as ``integration`
 
 from __future__ import annotations
 
+import logging
 import time
 
 import pytest
@@ -21,12 +22,55 @@ try:
 except ImportError:
     SYNC_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
+# Keep the module on one xdist worker so shared_sync_box boots once
 pytestmark = [
     pytest.mark.integration,
     pytest.mark.skipif(not SYNC_AVAILABLE, reason="greenlet not installed"),
+    pytest.mark.xdist_group("sync_api"),
 ]
 
 
+@pytest.fixture
+def alpine_sync_box(request, shared_sync_runtime, alpine_options):
+    """A fresh alpine SyncBox, stopped after the test even if it fails.
+
+    Extra BoxOptions arguments can be passed with indirect parametrization.
+    """
+    options = getattr(request, "param", None)
+    if options:
+        options = boxlite.BoxOptions(image="alpine:latest", **options)
+    else:
+        options = alpine_options
+    box = shared_sync_runtime.create(options)
+    try:
+        yield box
+    finally:
+        try:
+            box.stop()
+        except Exception as e:  # noqa: BLE001 - best-effort cleanup; the test outcome stands
+            logger.debug(f"Error stopping box {box.id}: {e}")
+
+
+@pytest.fixture(scope="module")
+def shared_sync_box(shared_sync_runtime, alpine_options):
+    """Module-scoped alpine SyncBox for tests that only run commands in it.
+
+    Booting a VM is the bulk of each test's time, so tests that neither change
+    the box nor depend on it being fresh share this one. Anything that stops
+    the box or inspects its creation uses ``alpine_sync_box`` instead.
+    """
+    box = shared_sync_runtime.create(alpine_options)
+    try:
+        yield box
+    finally:
+        try:
+            box.stop()
+        except Exception as e:  # noqa: BLE001 - best-effort cleanup; the test outcome stands
+            logger.debug(f"Error stopping box {box.id}: {e}")
+
+
 # =============================================================================
 # SyncBoxlite Tests
 # =============================================================================
@@ -57,93 +101,70 @@ class TestSyncBoxliteRuntime:
 class TestSyncBox:
     """Tests for SyncBox class."""
 
-    def test_create_box(self, shared_sync_runtime):
+    def test_create_box(self, alpine_sync_box):
         """Can create a box via runtime.create()."""
-        box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
-        assert box is not None
-        assert hasattr(box, "id")
-        assert box.id is not None
-        box.stop()
-
-    def test_box_has_no_sync_info(self, shared_sync_runtime):
+        assert alpine_sync_box is not None
+        assert hasattr(alpine_sync_box, "id")
+        assert alpine_sync_box.id is not None
+
+    @pytest.mark.parametrize(
+        "alpine_sync_box", [{"cpus": 2, "memory_mib": 256}], indirect=True
+    )
+    def test_box_has_no_sync_info(self, alpine_sync_box):
         """Box metadata is available only from the async API."""
-        box = shared_sync_runtime.create(
-            boxlite.BoxOptions(
-                image="alpine:latest",
-                cpus=2,
-                memory_mib=256,
-            )
-        )
-        assert not hasattr(box, "info")
-        box.stop()
+        assert not hasattr(alpine_sync_box, "info")
 
-    def test_box_exec_simple(self, shared_sync_runtime):
+    def test_box_exec_simple(self, shared_sync_box):
         """Can run simple command."""
-        box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
-        execution = box.exec("echo", ["hello", "world"])
+        execution = shared_sync_box.exec("echo", ["hello", "world"])
 
-        stdout_lines = list(execution.stdout())
-        assert len(stdout_lines) > 0
-        assert "hello world" in stdout_lines[0]
+        assert any("hello world" in line for line in execution.stdout())
 
         result = execution.wait()
         assert result.exit_code == 0
-        box.stop()
 
-    def test_box_exec_with_env(self, shared_sync_runtime):
+    def test_box_exec_with_env(self, shared_sync_box):
         """Can run command with environment variables."""
-        box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
-        execution = box.exec("sh", ["-c", "echo $MY_VAR"], [("MY_VAR", "test_value")])
+        execution = shared_sync_box.exec(
+            "sh", ["-c", "echo $MY_VAR"], [("MY_VAR", "test_value")]
+        )
 
-        stdout_lines = list(execution.stdout())
-        assert any("test_value" in line for line in stdout_lines)
+        assert any("test_value" in line for line in execution.stdout())
 
         result = execution.wait()
         assert result.exit_code == 0
-        box.stop()
 
-    def test_box_exec_stderr(self, shared_sync_runtime):
+    def test_box_exec_stderr(self, shared_sync_box):
         """Can capture stderr from command."""
-        box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
-        execution = box.exec("sh", ["-c", "echo error >&2"])
+        execution = shared_sync_box.exec("sh", ["-c", "echo error >&2"])
 
-        stderr_lines = list(execution.stderr())
-        assert len(stderr_lines) > 0
-        assert any("error" in line for line in stderr_lines)
+        assert any("error" in line for line in execution.stderr())
 
         result = execution.wait()
         assert result.exit_code == 0
-        box.stop()
 
-    def test_box_exec_nonzero_exit(self, shared_sync_runtime):
+    def test_box_exec_nonzero_exit(self, shared_sync_box):
         """Command with non-zero exit code is captured."""
-        box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
-        execution = box.exec("sh", ["-c", "exit 42"])
+        execution = shared_sync_box.exec("sh", ["-c", "exit 42"])
 
         list(execution.stdout())  # Consume output
         result = execution.wait()
         assert result.exit_code == 42
-        box.stop()
 
-    def test_box_metrics(self, shared_sync_runtime):
+    def test_box_metrics(self, shared_sync_box):
         """Can get box metrics."""
-        box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
-
         # Run a command to generate some metrics
-        execution = box.exec("echo", ["test"])
+        execution = shared_sync_box.exec("echo", ["test"])
         list(execution.stdout())
         execution.wait()
 
-        metrics = box.metrics()
+        metrics = shared_sync_box.metrics()
         assert metrics is not None
         assert metrics.commands_executed_total >= 1
-        box.stop()
 
-    def test_box_context_manager(self, shared_sync_runtime):
+    def test_box_context_manager(self, alpine_sync_box):
         """Box works as context manager."""
-        box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
-
-        with box:
+        with alpine_sync_box as box:
             execution = box.exec("echo", ["context manager"])
             stdout_lines = list(execution.stdout())
             assert len(stdout_lines) > 0
@@ -160,34 +181,32 @@ class TestSyncBox:
 class TestSyncExecution:
     """Tests for SyncExecution class."""
 
-    def test_execution_id(self, shared_sync_runtime):
+    def test_execution_id(self, shared_sync_box):
         """Execution has an id."""
-        box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
-        execution = box.exec("echo", ["test"])
+        execution = shared_sync_box.exec("echo", ["test"])
 
         assert execution.id is not None
 
         list(execution.stdout())
         execution.wait()
-        box.stop()
 
-    def test_execution_kill(self, shared_sync_runtime):
+    def test_execution_kill(self, shared_sync_box):
         """Can kill a running execution."""
-        box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
-        execution = box.exec("sleep", ["100"])
+        execution = shared_sync_box.exec("sh", ["-c", "echo started; exec sleep 100"])
 
-        time.sleep(0.5)  # Let it start
+        # The first line arrives once the process runs; no fixed sleep needed
+        assert next(iter(execution.stdout())).strip() == "started"
         execution.kill()
 
         result = execution.wait()
         # Killed processes typically have negative exit code (signal)
         assert result.exit_code != 0
-        box.stop()
 
-    def test_stdout_iteration(self, shared_sync_runtime):
+    def test_stdout_iteration(self, shared_sync_box):
         """Can iterate over stdout synchronously."""
-        box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
-        execution = box.exec("sh", ["-c", "echo line1; echo line2; echo line3"])
+        execution = shared_sync_box.exec(
+            "sh", ["-c", "echo line1; echo line2; echo line3"]
+        )
 
         lines = []
         for line in execution.stdout():
@@ -195,35 +214,29 @@ class TestSyncExecution:
 
         assert len(lines) >= 1  # May be combined or separate
         execution.wait()
-        box.stop()
 
-    def test_resize_tty_on_tty_execution(self, shared_sync_runtime):
+    def test_resize_tty_on_tty_execution(self, shared_sync_box):
         """resize_tty succeeds on a TTY-enabled execution."""
-        box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
-        execution = box.exec("sh", tty=True)
+        execution = shared_sync_box.exec("sh", tty=True)
 
         # Should not raise
         execution.resize_tty(40, 120)
 
         execution.kill()
         execution.wait()
-        box.stop()
 
-    def test_resize_tty_on_non_tty_execution(self, shared_sync_runtime):
+    def test_resize_tty_on_non_tty_execution(self, shared_sync_box):
         """resize_tty on a non-TTY execution raises an error."""
-        box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
-        execution = box.exec("echo", ["hello"])
+        execution = shared_sync_box.exec("echo", ["hello"])
 
         with pytest.raises(RuntimeError):
             execution.resize_tty(40, 120)
 
         execution.wait()
-        box.stop()
 
-    def test_resize_tty_various_dimensions(self, shared_sync_runtime):
+    def test_resize_tty_various_dimensions(self, shared_sync_box):
         """resize_tty accepts various terminal dimensions."""
-        box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
-        execution = box.exec("sh", tty=True)
+        execution = shared_sync_box.exec("sh", tty=True)
 
         # Small terminal
         execution.resize_tty(24, 80)
@@ -234,19 +247,16 @@ class TestSyncExecution:
 
         execution.kill()
         execution.wait()
-        box.stop()
 
-    def test_resize_tty_method_exists(self, shared_sync_runtime):
+    def test_resize_tty_method_exists(self, shared_sync_box):
         """SyncExecution has resize_tty method."""
-        box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
-        execution = box.exec("echo", ["test"])
+        execution = shared_sync_box.exec("echo", ["test"])
 
         assert hasattr(execution, "resize_tty")
         assert callable(execution.resize_tty)
 
         list(execution.stdout())
         execution.wait()
-        box.stop()
 
 
 # =============================================================================
@@ -257,32 +267,23 @@ class TestSyncExecution:
 class TestSyncBoxliteRuntimeMethods:
     """Tests for SyncBoxlite runtime methods."""
 
-    def test_get_box(self, shared_sync_runtime):
+    def test_get_box(self, shared_sync_runtime, alpine_sync_box):
         """Can get existing box by ID."""
-        box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
-        box_id = box.id
+        box_id = alpine_sync_box.id
 
         # Get by ID
         retrieved = shared_sync_runtime.get(box_id)
         assert retrieved is not None
         assert retrieved.id == box_id
 
-        box.stop()
-
     def test_get_nonexistent_box(self, shared_sync_runtime):
         """Getting non-existent box returns None."""
         retrieved = shared_sync_runtime.get("nonexistent-id-12345")
         assert retrieved is None
 
-    def test_runtime_metrics(self, shared_sync_runtime):
+    def test_runtime_metrics(self, shared_sync_runtime, alpine_sync_box):
         """Can get runtime metrics."""
-        # Create and stop a box to generate metrics
-        box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
-        execution = box.exec("echo", ["test"])
-        list(execution.stdout())
-        execution.wait()
-        box.stop()
-
+        # Creating the box is what the metric counts; no need to boot it
         metrics = shared_sync_runtime.metrics()
         assert metrics is not None
         assert metrics.boxes_created_total >= 1
@@ -296,11 +297,11 @@ class TestSyncBoxliteRuntimeMethods:
 class TestSyncAPIEdgeCases:
     """Tests for edge cases and error handling."""
 
-    def test_multiple_boxes_same_runtime(self, shared_sync_runtime):
+    def test_multiple_boxes_same_runtime(self, shared_sync_runtime, alpine_options):
         """Can create multiple boxes in same runtime."""
         boxes = []
         for i in range(3):
-            box = shared_sync_runtime.create(boxlite.BoxOptions(image="alpine:latest"))
+            box = shared_sync_runtime.create(alpine_options)
             boxes.append(box)
 
         assert len(boxes) == 3
@@ -309,12 +310,10 @@ class TestSyncAPIEdgeCases:
         for box in boxes:
             box.stop()
 
-    def test_box_with_named_id(self, shared_sync_runtime):
+    def test_box_with_named_id(self, shared_sync_runtime, alpine_options):
         """Can create box with custom name."""
         name = f"test-box-{int(time.time())}"
-        box = shared_sync_runtime.create(
-            boxlite.BoxOptions(image="alpine:latest"), name=name
-        )
+        box = shared_sync_runtime.create(alpine_options, name=name)
 
         # Should be retrievable by name
         retrieved = shared_sync_runtime.get(name)
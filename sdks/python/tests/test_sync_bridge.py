@@ -0,0 +1,392 @@
+"""Unit tests for the greenlet sync bridge (no VM required)."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import types
+
+import pytest
+
+pytest.importorskip("greenlet")
+
+from boxlite.sync_api import _boxlite
+from boxlite.sync_api._sync_base import SyncBase
+
+
+class _CountingFiber:
+    def __init__(self, fiber) -> None:
+        self._fiber = fiber
+        self.switches = 0
+
+    def switch(self):
+        self.switches += 1
+        return self._fiber.switch()
+
+
+class _ResumingFiber:
+    """Returns to the caller at once, without running the event loop."""
+
+    def __init__(self, fiber) -> None:
+        pass
+
+    def switch(self):
+        return None
+
+
+def _use_fiber(runtime, monkeypatch, fiber_type):
+    """Point the runtime's _sync() at a SyncBase switching to ``fiber_type``."""
+    fiber = fiber_type(runtime._dispatcher_fiber)
+    monkeypatch.setattr(runtime, "_sync_helper", SyncBase(None, runtime._loop, fiber))
+    return fiber
+
+
+def test_sync_returns_coroutine_result(dispatcher_runtime):
+    async def delayed(value):
+        await asyncio.sleep(0.01)
+        return value
+
+    assert dispatcher_runtime._sync(delayed("done")) == "done"
+
+
+def test_sync_propagates_exceptions(dispatcher_runtime):
+    async def boom():
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        dispatcher_runtime._sync(boom())
+
+
+def test_stop_closes_owned_loop(dispatcher_runtime):
+    loop = dispatcher_runtime._loop
+
+    dispatcher_runtime.stop()
+    dispatcher_runtime.start()  # leave the fixture something to stop
+
+    assert loop.is_closed()
+
+
+class _FakeUvloop(types.ModuleType):
+    """Stands in for uvloop, recording the loops it hands out."""
+
+    def __init__(self) -> None:
+        super().__init__("uvloop")
+        self.loops = []
+
+    def new_event_loop(self):
+        loop = asyncio.new_event_loop()
+        self.loops.append(loop)
+        return loop
+
+
+def test_dispatcher_ignores_installed_uvloop_by_default(monkeypatch):
+    fake = _FakeUvloop()
+    monkeypatch.setitem(sys.modules, "uvloop", fake)
+    monkeypatch.setattr(_boxlite, "_USE_UVLOOP", False)
+
+    loop = _boxlite._new_event_loop()
+    loop.close()
+
+    assert fake.loops == []
+
+
+def test_dispatcher_uses_uvloop_when_enabled(monkeypatch):
+    fake = _FakeUvloop()
+    monkeypatch.setitem(sys.modules, "uvloop", fake)
+    monkeypatch.setattr(_boxlite, "_USE_UVLOOP", True)
+
+    loop = _boxlite._new_event_loop()
+    loop.close()
+
+    assert fake.loops == [loop]
+
+
+def test_enabling_uvloop_without_it_installed_fails_clearly(monkeypatch):
+    # A None entry makes ``import uvloop`` raise ImportError
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+    with pytest.raises(ImportError, match=r"boxlite\[uvloop\]"):
+        _boxlite._new_event_loop(use_uvloop=True)
+
+
+def test_sync_completes_non_suspending_coroutine(dispatcher_runtime):
+    async def immediate():
+        return 42
+
+    assert dispatcher_runtime._sync(immediate()) == 42
+    # A later suspending call must still round-trip normally.
+    assert dispatcher_runtime._sync(asyncio.sleep(0, result="next")) == "next"
+
+
+@pytest.mark.skipif(
+    not hasattr(asyncio, "eager_task_factory"), reason="needs Python 3.12+"
+)
+def test_dispatcher_loop_runs_tasks_eagerly(dispatcher_runtime):
+    started = []
+
+    async def record():
+        started.append(True)
+        await asyncio.sleep(0)
+
+    task = dispatcher_runtime._loop.create_task(record())
+
+    assert started == [True]
+    dispatcher_runtime._sync(task)
+
+
+@pytest.mark.skipif(
+    not hasattr(asyncio, "eager_task_factory"), reason="needs Python 3.12+"
+)
+def test_sync_skips_dispatcher_for_non_suspending_coroutine(
+    dispatcher_runtime, monkeypatch
+):
+    fiber = _use_fiber(dispatcher_runtime, monkeypatch, _CountingFiber)
+
+    async def immediate():
+        return asyncio.current_task() is not None
+
+    assert dispatcher_runtime._sync(immediate()) is True
+    assert fiber.switches == 0
+
+
+def test_wrappers_share_the_runtime_sync_helper(dispatcher_runtime):
+    from boxlite.sync_api._box import SyncBox
+    from boxlite.sync_api._execution import SyncExecution
+
+    class _FakeExecution:
+        def stdout(self):
+            return object()
+
+    box = SyncBox(dispatcher_runtime, object())
+    execution = SyncExecution(dispatcher_runtime, _FakeExecution())
+
+    assert box._sync_helper is dispatcher_runtime.sync_helper
+    assert execution._sync_helper is dispatcher_runtime.sync_helper
+    assert execution.stdout()._sync_helper is dispatcher_runtime.sync_helper
+
+
+def test_sync_waits_on_futures_without_wrapping_them_in_tasks(dispatcher_runtime):
+    loop = dispatcher_runtime._loop
+    fut = loop.create_future()
+    loop.call_later(0.01, fut.set_result, "native")
+
+    assert dispatcher_runtime._sync(fut) == "native"
+    assert asyncio.all_tasks(loop) == set()
+
+
+def test_start_refuses_inside_running_loop():
+    from boxlite.sync_api._boxlite import SyncBoxlite
+
+    async def enter():
+        SyncBoxlite.__new__(SyncBoxlite).start()
+
+    with pytest.raises(RuntimeError, match="inside an asyncio loop"):
+        asyncio.run(enter())
+
+
+def test_stop_finishes_the_dispatcher_fiber(dispatcher_runtime):
+    fiber = dispatcher_runtime._dispatcher_fiber
+
+    dispatcher_runtime.stop()
+    dispatcher_runtime.start()  # leave the fixture something to stop
+
+    assert fiber.dead
+
+
+@pytest.mark.parametrize("call", ["remove", "shutdown", "metrics"])
+def test_runtime_methods_require_start_before_native_call(call):
+    from boxlite.sync_api._boxlite import SyncBoxlite
+
+    class _NativeRuntime:
+        def __getattr__(self, name):
+            raise AssertionError(f"native {name}() reached before start check")
+
+    rt = object.__new__(SyncBoxlite)
+    rt._boxlite = _NativeRuntime()
+    rt._started = False
+
+    with pytest.raises(RuntimeError, match="not started"):
+        getattr(rt, call)(*(["box-id"] if call == "remove" else []))
+
+
+def test_runtime_methods_check_started_once(dispatcher_runtime, monkeypatch):
+    class _NativeRuntime:
+        async def get(self, id_or_name):
+            return None
+
+    def guarded_sync(coro):
+        raise AssertionError("runtime method re-checked start state in _sync")
+
+    dispatcher_runtime._boxlite = _NativeRuntime()
+    monkeypatch.setattr(dispatcher_runtime, "_sync", guarded_sync)
+
+    assert dispatcher_runtime.get("box-id") is None
+
+
+def _stopped_runtime():
+    from boxlite.sync_api._boxlite import SyncBoxlite
+
+    rt = object.__new__(SyncBoxlite)
+    rt._boxlite = None
+    rt._sync_helper = None
+    rt._started = False
+    return rt
+
+
+class _UnreachableBox:
+    """Async box whose exec must not run once the runtime is stopped."""
+
+    async def exec(self, *args, **kwargs):
+        raise AssertionError("exec reached on a stopped runtime")
+
+
+def test_simplebox_exec_on_stopped_runtime_raises_not_started():
+    from boxlite.sync_api._simplebox import SyncSimpleBox
+
+    box = object.__new__(SyncSimpleBox)
+    box._runtime = _stopped_runtime()
+    box._box = types.SimpleNamespace(_box=_UnreachableBox())
+
+    with pytest.raises(RuntimeError, match="not started"):
+        box.exec("echo", "hi")
+
+
+def test_codebox_run_script_on_stopped_runtime_raises_not_started(tmp_path):
+    from boxlite.sync_api._codebox import SyncCodeBox
+
+    script = tmp_path / "script.py"
+    script.write_text("print('hi')\n")
+    box = object.__new__(SyncCodeBox)
+    box._runtime = _stopped_runtime()
+    box._box = types.SimpleNamespace(_box=_UnreachableBox())
+
+    with pytest.raises(RuntimeError, match="not started"):
+        box.run_script(str(script))
+
+
+def test_sync_captures_caller_stack_only_on_failure(dispatcher_runtime):
+    async def ok():
+        await asyncio.sleep(0)
+
+    async def boom():
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    dispatcher_runtime._sync(ok())
+    with pytest.raises(ValueError) as excinfo:
+        dispatcher_runtime._sync(boom())
+
+    stack = excinfo.value.__boxlite_stack__
+    assert stack[-1].name == "_sync"
+    # The caller's frames are kept; the greenlet machinery is not
+    assert any(
+        frame.name == "test_sync_captures_caller_stack_only_on_failure"
+        and frame.filename == __file__
+        for frame in stack
+    )
+    assert not any("greenlet" in frame.filename for frame in stack)
+
+
+def test_sync_switches_to_dispatcher_once_per_suspending_call(
+    dispatcher_runtime, monkeypatch
+):
+    fiber = _use_fiber(dispatcher_runtime, monkeypatch, _CountingFiber)
+
+    async def several_turns():
+        for _ in range(5):
+            await asyncio.sleep(0)
+        return "done"
+
+    assert dispatcher_runtime._sync(several_turns()) == "done"
+    assert fiber.switches == 1
+
+
+def test_sync_rejects_resume_before_task_finished(dispatcher_runtime, monkeypatch):
+    from greenlet import getcurrent
+
+    _use_fiber(dispatcher_runtime, monkeypatch, _ResumingFiber)
+    fut = dispatcher_runtime._loop.create_future()
+
+    with pytest.raises(RuntimeError, match="before its task finished"):
+        dispatcher_runtime._sync(fut)
+
+    fut.remove_done_callback(getcurrent().switch)
+
+
+def test_sync_returns_resolved_future_without_switching(
+    dispatcher_runtime, monkeypatch
+):
+    fiber = _use_fiber(dispatcher_runtime, monkeypatch, _CountingFiber)
+    fut = dispatcher_runtime._loop.create_future()
+    fut.set_result("cached")
+
+    assert dispatcher_runtime._sync(fut) == "cached"
+    assert fiber.switches == 0
+
+
+def test_sync_on_closed_loop_closes_coroutine(dispatcher_runtime):
+    async def never_run():
+        raise AssertionError("must not run")
+
+    coro = never_run()
+    loop = dispatcher_runtime._loop
+    # Held past stop(), as wrappers holding the helper would
+    helper = dispatcher_runtime.sync_helper
+    dispatcher_runtime.stop()
+    try:
+        with pytest.raises(RuntimeError, match="Event loop is closed"):
+            helper._sync(coro)
+        with pytest.raises(RuntimeError, match="Event loop is closed"):
+            helper._sync(loop.create_future())
+    finally:
+        dispatcher_runtime.start()  # leave the fixture something to stop
+
+    assert coro.cr_frame is None
+
+
+def test_runtime_sync_after_stop_raises_not_started_and_closes_coroutine(
+    dispatcher_runtime,
+):
+    async def never_run():
+        raise AssertionError("must not run")
+
+    coro = never_run()
+    dispatcher_runtime.stop()
+    try:
+        with pytest.raises(RuntimeError, match="not started"):
+            dispatcher_runtime._sync(coro)
+    finally:
+        dispatcher_runtime.start()  # leave the fixture something to stop
+
+    assert coro.cr_frame is None
+
+
+def test_sync_base_subclass_override_is_kept(dispatcher_runtime):
+    class Traced(SyncBase):
+        def _sync(self, coro):
+            return ("traced", super()._sync(coro))
+
+    helper = Traced(
+        None, dispatcher_runtime._loop, dispatcher_runtime._dispatcher_fiber
+    )
+
+    assert helper._sync(asyncio.sleep(0, result=1)) == ("traced", 1)
+
+
+def test_sync_rejects_future_from_another_loop(dispatcher_runtime):
+    other_loop = asyncio.new_event_loop()
+    try:
+        with pytest.raises(ValueError, match="loop"):
+            dispatcher_runtime._sync(other_loop.create_future())
+    finally:
+        other_loop.close()
+
+
+def test_sync_accepts_generic_awaitables(dispatcher_runtime):
+    class _Awaitable:
+        def __await__(self):
+            yield from asyncio.sleep(0).__await__()
+            return "awaited"
+
+    assert dispatcher_runtime._sync(_Awaitable()) == "awaited"
@@ -17,12 +17,33 @@ try:
 except ImportError:
     SYNC_AVAILABLE = False
 
+# Keep the module on one xdist worker so its shared boxes boot once
 pytestmark = [
     pytest.mark.integration,
     pytest.mark.skipif(not SYNC_AVAILABLE, reason="greenlet not installed"),
+    pytest.mark.xdist_group("sync_codebox"),
 ]
 
 
+@pytest.fixture(scope="module")
+def installed_codebox(shared_sync_runtime):
+    """One SyncCodeBox with six and packaging installed, plus the pip output.
+
+    pip install is the slowest step here (network and disk), so the install
+    tests share a single install instead of each paying for one.
+    """
+    with SyncCodeBox(runtime=shared_sync_runtime) as box:
+        yield box, box.install_packages("six", "packaging")
+
+
+@pytest.fixture(scope="session")
+def hello_script(tmp_path_factory):
+    """Path of a script printing a greeting, written once per session."""
+    script = tmp_path_factory.mktemp("scripts") / "hello.py"
+    script.write_text("print('Hello from script!')\n")
+    return str(script)
+
+
 class TestSyncCodeBox:
     """Tests for SyncCodeBox convenience wrapper."""
 
@@ -32,75 +53,58 @@ class TestSyncCodeBox:
             assert box is not None
             assert box.id is not None
 
-    def test_default_image(self, shared_sync_runtime):
+    def test_default_image(self, shared_sync_codebox):
         """Uses Python image by default."""
-        with SyncCodeBox(runtime=shared_sync_runtime) as box:
-            assert "python" in box._box_opts.image.lower()
-
-    def test_run_simple(self, shared_sync_runtime):
-        """Can run simple Python code."""
-        with SyncCodeBox(runtime=shared_sync_runtime) as box:
-            result = box.run("print('Hello, World!')")
-            assert "Hello, World!" in result
-
-    def test_run_arithmetic(self, shared_sync_runtime):
-        """Can run arithmetic operations."""
-        with SyncCodeBox(runtime=shared_sync_runtime) as box:
-            result = box.run("print(2 + 2)")
-            assert "4" in result
-
-    def test_run_multiline(self, shared_sync_runtime):
-        """Can run multiline code."""
-        with SyncCodeBox(runtime=shared_sync_runtime) as box:
-            code = """
-x = 10
-y = 20
-print(x + y)
-"""
-            result = box.run(code)
-            assert "30" in result
-
-    def test_run_with_imports(self, shared_sync_runtime):
-        """Can run code with stdlib imports."""
-        with SyncCodeBox(runtime=shared_sync_runtime) as box:
-            code = """
-import math
-print(round(math.pi, 2))
-"""
-            result = box.run(code)
-            assert "3.14" in result
-
-    def test_run_exception(self, shared_sync_runtime):
+        assert "python" in shared_sync_codebox._box_opts.image.lower()
+
+    @pytest.mark.parametrize(
+        ("code", "expected"),
+        [
+            pytest.param("print('Hello, World!')", "Hello, World!", id="simple"),
+            pytest.param("print(2 + 2)", "4", id="arithmetic"),
+            pytest.param("x = 10\ny = 20\nprint(x + y)\n", "30", id="multiline"),
+            pytest.param(
+                "import math\nprint(round(math.pi, 2))\n", "3.14", id="imports"
+            ),
+        ],
+    )
+    def test_run(self, shared_sync_codebox, code, expected):
+        """run() returns the stdout of the executed code."""
+        assert expected in shared_sync_codebox.run(code)
+
+    def test_state_not_shared_between_runs(self, shared_sync_codebox):
+        """Each run() starts a fresh interpreter, so names don't carry over."""
+        shared_sync_codebox.run("x = 42")
+        result = shared_sync_codebox.exec("/usr/local/bin/python", "-c", "print(x)")
+        assert result.exit_code != 0
+        assert result.stdout == ""
+        assert "NameError" in result.stderr
+
+    def test_run_exception(self, shared_sync_codebox):
         """Exceptions go to stderr, not run() output."""
-        with SyncCodeBox(runtime=shared_sync_runtime) as box:
-            result = box.exec(
-                "/usr/local/bin/python", "-c", "raise ValueError('test error')"
-            )
-            assert "ValueError" in result.stderr or "test error" in result.stderr
+        result = shared_sync_codebox.exec(
+            "/usr/local/bin/python", "-c", "raise ValueError('test error')"
+        )
+        assert "ValueError" in result.stderr or "test error" in result.stderr
 
     @pytest.mark.slow
-    def test_install_package(self, shared_sync_runtime):
-        """Can install a package."""
-        with SyncCodeBox(runtime=shared_sync_runtime) as box:
-            result = box.install_package("six")
-            assert (
-                "Successfully installed" in result
-                or "already satisfied" in result.lower()
-            )
+    @pytest.mark.timeout(600)
+    def test_install_packages(self, installed_codebox):
+        """Can install packages."""
+        _, output = installed_codebox
+        assert (
+            "Successfully installed" in output or "already satisfied" in output.lower()
+        )
 
     @pytest.mark.slow
-    def test_install_and_use(self, shared_sync_runtime):
-        """Can install and use a package."""
-        with SyncCodeBox(runtime=shared_sync_runtime) as box:
-            box.install_package("six")
-            result = box.run("import six; print(six.PY3)")
-            assert "True" in result
-
-    def test_run_script(self, shared_sync_runtime, tmp_path):
+    @pytest.mark.timeout(600)
+    def test_install_and_use(self, installed_codebox):
+        """Can install and use packages."""
+        box, _ = installed_codebox
+        result = box.run("import six, packaging; print(six.PY3)")
+        assert "True" in result
+
+    def test_run_script(self, shared_sync_codebox, hello_script):
         """Can run a script file."""
-        script = tmp_path / "test_script.py"
-        script.write_text("print('Hello from script!')\n")
-
-        with SyncCodeBox(runtime=shared_sync_runtime) as box:
-            result = box.run_script(str(script))
-            assert "Hello from script!" in result
+        result = shared_sync_codebox.run_script(hello_script)
+        assert "Hello from script!" in result
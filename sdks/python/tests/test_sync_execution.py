@@ -0,0 +1,330 @@
+"""Unit tests for the sync stdout/stderr iterators (no VM required)."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+
+import pytest
+
+pytest.importorskip("greenlet")
+
+from boxlite.sync_api._execution import (
+    SyncExecStderr,
+    SyncExecStdout,
+    SyncExecution,
+)
+
+
+class _FakeStream:
+    """Async line stream; ``slow_every`` lines arrive only after a delay."""
+
+    def __init__(self, lines, error=None, slow_every=0) -> None:
+        self._lines = list(lines)
+        self._error = error
+        self._slow_every = slow_every
+        self.reads = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        self.reads += 1
+        if self._slow_every and self.reads % self._slow_every == 0:
+            await asyncio.sleep(0.001)
+        if self._lines:
+            return self._lines.pop(0)
+        if self._error is not None:
+            raise self._error
+        raise StopAsyncIteration
+
+
+@pytest.fixture
+def count_syncs(dispatcher_runtime, monkeypatch):
+    calls = []
+    real_sync = dispatcher_runtime.sync_helper._sync
+
+    def counting_sync(coro):
+        calls.append(coro)
+        return real_sync(coro)
+
+    monkeypatch.setattr(dispatcher_runtime.sync_helper, "_sync", counting_sync)
+    return calls
+
+
+@pytest.mark.parametrize("wrapper", [SyncExecStdout, SyncExecStderr])
+def test_iterator_yields_every_line_in_order(dispatcher_runtime, wrapper):
+    lines = [f"line {i}\n" for i in range(200)]
+
+    stream = wrapper(dispatcher_runtime, _FakeStream(lines, slow_every=7))
+
+    assert list(stream) == lines
+
+
+def test_iterator_batches_ready_lines(dispatcher_runtime, count_syncs):
+    lines = [f"line {i}\n" for i in range(200)]
+
+    assert list(SyncExecStdout(dispatcher_runtime, _FakeStream(lines))) == lines
+    assert len(count_syncs) < len(lines) // 10
+
+
+def test_iterator_decodes_bytes(dispatcher_runtime):
+    stream = SyncExecStdout(
+        dispatcher_runtime, _FakeStream([b"caf\xc3\xa9\n", b"plain\n"])
+    )
+
+    assert list(stream) == ["café\n", "plain\n"]
+
+
+def test_iterator_raises_stream_error_after_earlier_lines(dispatcher_runtime):
+    stream = iter(
+        SyncExecStdout(dispatcher_runtime, _FakeStream(["a", "b"], OSError("gone")))
+    )
+
+    assert next(stream) == "a"
+    assert next(stream) == "b"
+    with pytest.raises(OSError, match="gone"):
+        next(stream)
+
+
+class _HangingStream:
+    """Yields one line, then a read that never completes."""
+
+    def __init__(self) -> None:
+        self.read_ahead = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.read_ahead is None:
+            self.read_ahead = asyncio.current_task()
+            return "first\n"
+        self.read_ahead = asyncio.current_task()
+        await asyncio.Event().wait()
+
+
+def test_close_cancels_read_ahead_of_abandoned_iteration(dispatcher_runtime):
+    async_stream = _HangingStream()
+    stream = SyncExecStdout(dispatcher_runtime, async_stream)
+
+    assert next(iter(stream)) == "first\n"
+    read_ahead = async_stream.read_ahead
+    assert not read_ahead.done()
+
+    stream.close()
+    dispatcher_runtime.sync_helper._sync(asyncio.sleep(0))
+
+    assert read_ahead.cancelled()
+    with pytest.raises(StopIteration):
+        next(stream)
+
+
+class _FailingLaterStream:
+    """Yields one line; the next read fails, but only after a delay."""
+
+    def __init__(self) -> None:
+        self._sent = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._sent:
+            self._sent = True
+            return "first\n"
+        await asyncio.sleep(0.01)
+        raise OSError("stream broke")
+
+
+def test_dropped_iterator_leaves_no_unretrieved_stream_error(dispatcher_runtime):
+    loop = dispatcher_runtime._loop
+    reported = []
+    loop.set_exception_handler(lambda _loop, context: reported.append(context))
+    try:
+        stream = SyncExecStdout(dispatcher_runtime, _FailingLaterStream())
+        assert next(iter(stream)) == "first\n"
+        # Stop reading while the read-ahead is still in flight
+        del stream
+        gc.collect()
+        dispatcher_runtime.sync_helper._sync(asyncio.sleep(0.05))
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+
+    assert reported == []
+
+
+def test_empty_stream_stops_immediately(dispatcher_runtime):
+    assert list(SyncExecStderr(dispatcher_runtime, _FakeStream([]))) == []
+
+
+class _FakeWaitResult:
+    exit_code = 2
+    error_message = None
+
+
+class _FakeExecution:
+    def __init__(self, stdout, stderr) -> None:
+        self._stdout = stdout
+        self._stderr = stderr
+
+    def stdout(self):
+        return self._stdout
+
+    def stderr(self):
+        return self._stderr
+
+    async def wait(self):
+        return _FakeWaitResult()
+
+
+def test_wait_with_output_collects_in_one_round_trip(dispatcher_runtime, count_syncs):
+    execution = SyncExecution(
+        dispatcher_runtime,
+        _FakeExecution(
+            _FakeStream([b"out 1\n", b"out 2\n"], slow_every=1), _FakeStream(["err\n"])
+        ),
+    )
+
+    result = execution.wait_with_output()
+
+    assert (result.exit_code, result.stdout, result.stderr) == (
+        2,
+        "out 1\nout 2\n",
+        "err\n",
+    )
+    assert len(count_syncs) == 1
+
+
+def test_execution_wrappers_have_no_instance_dict(dispatcher_runtime):
+    execution = SyncExecution(dispatcher_runtime, _FakeExecution(_FakeStream([]), None))
+
+    for wrapper in (execution, execution.stdout()):
+        assert not hasattr(wrapper, "__dict__")
+
+
+def test_collected_output_decodes_split_utf8_once(dispatcher_runtime):
+    encoded = "héllo 世界\n".encode()
+    chunks = [encoded[:2], encoded[2:9], encoded[9:]]
+    execution = SyncExecution(
+        dispatcher_runtime, _FakeExecution(_FakeStream(chunks), _FakeStream([]))
+    )
+
+    result = execution.wait_with_output()
+
+    assert result.stdout == "héllo 世界\n"
+    assert result.stderr == ""
+
+
+class _GatedStream:
+    """Yields one chunk only after ``gate`` is set, then sets ``signal``."""
+
+    def __init__(self, chunk, gate, signal) -> None:
+        self._chunk = chunk
+        self._gate = gate
+        self._signal = signal
+        self._done = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._done:
+            raise StopAsyncIteration
+        self._signal.set()
+        await self._gate.wait()
+        self._done = True
+        return self._chunk
+
+
+def test_collected_output_drains_streams_concurrently(dispatcher_runtime):
+    # Each stream blocks until the other has started producing; draining
+    # them one after the other would never finish.
+    stdout_started = asyncio.Event()
+    stderr_started = asyncio.Event()
+    execution = SyncExecution(
+        dispatcher_runtime,
+        _FakeExecution(
+            _GatedStream("out", stderr_started, stdout_started),
+            _GatedStream("err", stdout_started, stderr_started),
+        ),
+    )
+
+    result = execution.wait_with_output()
+
+    assert (result.stdout, result.stderr) == ("out", "err")
+
+
+def test_collected_output_reports_wait_failure_as_exit_code(dispatcher_runtime):
+    class _FailingWait(_FakeExecution):
+        async def wait(self):
+            raise RuntimeError("lost")
+
+    execution = SyncExecution(
+        dispatcher_runtime, _FailingWait(_FakeStream(["partial"]), _FakeStream([]))
+    )
+
+    result = execution.wait_with_output()
+
+    assert (result.exit_code, result.stdout) == (-1, "partial")
+    assert result.error_message == "lost"
+
+
+def test_collected_output_wait_failure_matches_native_collection(dispatcher_runtime):
+    class _FailingWait(_FakeExecution):
+        async def wait(self):
+            raise RuntimeError("lost")
+
+    class _NativeFailingWait(_FakeExecution):
+        # What the binding returns when wait() fails inside Tokio
+        async def collect_output(self):
+            return -1, "partial", "", "lost"
+
+    fallback = SyncExecution(
+        dispatcher_runtime, _FailingWait(_FakeStream(["partial"]), _FakeStream([]))
+    ).wait_with_output()
+    native = SyncExecution(
+        dispatcher_runtime, _NativeFailingWait(_FakeStream([]), _FakeStream([]))
+    ).wait_with_output()
+
+    assert fallback == native
+
+
+def test_simplebox_exec_collects_in_one_round_trip(dispatcher_runtime, count_syncs):
+    from boxlite.sync_api._box import SyncBox
+    from boxlite.sync_api._simplebox import SyncSimpleBox
+
+    lines = [f"line {i}\n" for i in range(500)]
+
+    class _FakeAsyncBox:
+        async def exec(self, cmd, args, env, user=None, timeout_secs=None, cwd=None):
+            return _FakeExecution(
+                _FakeStream(lines, slow_every=10), _FakeStream(["warn\n"] * 50)
+            )
+
+    box = SyncSimpleBox.__new__(SyncSimpleBox)
+    box._runtime = dispatcher_runtime
+    box._box = SyncBox(dispatcher_runtime, _FakeAsyncBox())
+
+    result = box.exec("cat", "big.txt")
+
+    assert result.stdout == "".join(lines)
+    assert result.stderr == "warn\n" * 50
+    assert len(count_syncs) == 1
+
+
+def test_collected_output_prefers_native_collection(dispatcher_runtime, count_syncs):
+    class _NativeCollecting(_FakeExecution):
+        async def collect_output(self):
+            return 0, "out\n", "err\n", None
+
+    execution = SyncExecution(
+        dispatcher_runtime,
+        _NativeCollecting(_FakeStream(["unused\n"]), _FakeStream([])),
+    )
+
+    result = execution.wait_with_output()
+
+    assert (result.exit_code, result.stdout, result.stderr) == (0, "out\n", "err\n")
+    assert len(count_syncs) == 1
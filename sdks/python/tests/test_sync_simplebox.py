@@ -9,20 +9,28 @@ from __future__ import annotations
 
 import pytest
 
-# Try to import sync API - skip if greenlet not installed
-try:
-    from boxlite import SyncSimpleBox
+pytest.importorskip("greenlet")
 
-    SYNC_AVAILABLE = True
-except ImportError:
-    SYNC_AVAILABLE = False
+from boxlite import SyncSimpleBox
+from tests._helpers import assert_contains
 
+# Keep the module on one xdist worker so its shared box boots once
 pytestmark = [
     pytest.mark.integration,
-    pytest.mark.skipif(not SYNC_AVAILABLE, reason="greenlet not installed"),
+    pytest.mark.xdist_group("sync_simplebox"),
+    pytest.mark.usefixtures("alpine_image"),
 ]
 
 
+@pytest.fixture
+def configured_box(request, shared_sync_runtime):
+    """A fresh alpine SyncSimpleBox built with the constructor kwargs in ``request.param``."""
+    with SyncSimpleBox(
+        image="alpine:latest", runtime=shared_sync_runtime, **request.param
+    ) as box:
+        yield box
+
+
 class TestSyncSimpleBox:
     """Tests for SyncSimpleBox convenience wrapper."""
 
@@ -32,105 +40,86 @@ class TestSyncSimpleBox:
             assert box is not None
             assert box.id is not None
 
-    def test_exec_basic(self, shared_sync_runtime):
+    def test_exec_basic(self, shared_sync_simplebox):
         """Can run basic command."""
-        with SyncSimpleBox(image="alpine:latest", runtime=shared_sync_runtime) as box:
-            result = box.exec("echo", "hello")
-            assert result.exit_code == 0
-            assert "hello" in result.stdout
+        result = shared_sync_simplebox.exec("echo", "hello")
+        assert result.exit_code == 0
+        assert "hello" in result.stdout
 
-    def test_exec_with_args(self, shared_sync_runtime):
+    def test_exec_with_args(self, shared_sync_simplebox):
         """Can run command with multiple arguments."""
-        with SyncSimpleBox(image="alpine:latest", runtime=shared_sync_runtime) as box:
-            result = box.exec("ls", "-la", "/")
-            assert result.exit_code == 0
-            assert "bin" in result.stdout
-
-    def test_exec_with_env(self, shared_sync_runtime):
-        """Can run command with environment variables."""
-        with SyncSimpleBox(image="alpine:latest", runtime=shared_sync_runtime) as box:
-            result = box.exec("env", env={"FOO": "bar"})
-            assert "FOO=bar" in result.stdout
-
-    def test_exec_stdout_stderr(self, shared_sync_runtime):
-        """Captures both stdout and stderr."""
-        with SyncSimpleBox(image="alpine:latest", runtime=shared_sync_runtime) as box:
-            result = box.exec("sh", "-c", "echo stdout && echo stderr >&2")
-            assert "stdout" in result.stdout
-            assert "stderr" in result.stderr
-
-    def test_exec_exit_code(self, shared_sync_runtime):
-        """Captures non-zero exit codes."""
-        with SyncSimpleBox(image="alpine:latest", runtime=shared_sync_runtime) as box:
-            result = box.exec("sh", "-c", "exit 42")
-            assert result.exit_code == 42
+        result = shared_sync_simplebox.exec("ls", "-la", "/")
+        assert result.exit_code == 0
+        assert "bin" in result.stdout
+
+    def test_exec_combined_probes(self, shared_sync_simplebox):
+        """Captures stdout, stderr, env and a non-zero exit code from one exec."""
+        result = shared_sync_simplebox.exec(
+            "sh",
+            "-c",
+            'echo stdout; echo stderr >&2; echo "env=$FOO"; exit 42',
+            env={"FOO": "bar"},
+        )
+        assert result.exit_code == 42
+        assert_contains(result.stdout, "stdout", "env=bar")
+        assert "stderr" in result.stderr
+        assert "stderr" not in result.stdout
 
-    def test_has_no_sync_info(self, shared_sync_runtime):
+    @pytest.mark.parametrize("configured_box", [{"cpus": 2}], indirect=True)
+    def test_has_no_sync_info(self, configured_box):
         """Box metadata is available only from the async API."""
-        with SyncSimpleBox(
-            image="alpine:latest", cpus=2, runtime=shared_sync_runtime
-        ) as box:
-            assert not hasattr(box, "info")
+        assert not hasattr(configured_box, "info")
 
-    def test_metrics(self, shared_sync_runtime):
+    def test_metrics(self, shared_sync_simplebox):
         """Can get box metrics."""
-        with SyncSimpleBox(image="alpine:latest", runtime=shared_sync_runtime) as box:
-            box.exec("echo", "test")
-            metrics = box.metrics()
-            assert metrics is not None
-            assert metrics.commands_executed_total >= 1
-
-    def test_custom_working_dir(self, shared_sync_runtime):
-        """Can set custom working directory."""
-        with SyncSimpleBox(
-            image="alpine:latest", working_dir="/tmp", runtime=shared_sync_runtime
-        ) as box:
-            result = box.exec("pwd")
-            assert result.stdout.strip() == "/tmp"
-
-    def test_box_level_env(self, shared_sync_runtime):
-        """Can set box-level environment variables."""
-        with SyncSimpleBox(
-            image="alpine:latest",
-            env=[("MY_VAR", "my_value")],
-            runtime=shared_sync_runtime,
-        ) as box:
-            result = box.exec("env")
-            assert "MY_VAR=my_value" in result.stdout
-
-    def test_exec_with_cwd(self, shared_sync_runtime):
+        shared_sync_simplebox.exec("echo", "test")
+        metrics = shared_sync_simplebox.metrics()
+        assert metrics is not None
+        assert metrics.commands_executed_total >= 1
+
+    @pytest.mark.parametrize(
+        ("configured_box", "command", "expected"),
+        [
+            pytest.param({"working_dir": "/tmp"}, "pwd", "/tmp", id="working_dir"),
+            pytest.param(
+                {"env": [("MY_VAR", "my_value")]}, "env", "MY_VAR=my_value", id="env"
+            ),
+        ],
+        indirect=["configured_box"],
+    )
+    def test_constructor_option(self, configured_box, command, expected):
+        """Box-level options given to the constructor apply to every exec."""
+        result = configured_box.exec(command)
+        assert expected in result.stdout
+
+    def test_exec_with_cwd(self, shared_sync_simplebox):
         """Per-exec cwd overrides working directory."""
-        with SyncSimpleBox(image="alpine:latest", runtime=shared_sync_runtime) as box:
-            result = box.exec("pwd", cwd="/tmp")
-            assert result.exit_code == 0
-            assert result.stdout.strip() == "/tmp"
+        result = shared_sync_simplebox.exec("pwd", cwd="/tmp")
+        assert result.exit_code == 0
+        assert result.stdout.strip() == "/tmp"
 
-    def test_exec_with_user(self, shared_sync_runtime):
+    def test_exec_with_user(self, shared_sync_simplebox):
         """Per-exec user overrides the execution user."""
-        with SyncSimpleBox(image="alpine:latest", runtime=shared_sync_runtime) as box:
-            result = box.exec("whoami", user="nobody")
-            assert result.exit_code == 0
-            assert "nobody" in result.stdout
+        result = shared_sync_simplebox.exec("whoami", user="nobody")
+        assert result.exit_code == 0
+        assert "nobody" in result.stdout
 
-    def test_exec_with_timeout(self, shared_sync_runtime):
+    def test_exec_with_timeout(self, shared_sync_simplebox):
         """Per-exec timeout kills long-running commands."""
-        with SyncSimpleBox(image="alpine:latest", runtime=shared_sync_runtime) as box:
-            result = box.exec("sleep", "60", timeout=2)
-            assert result.exit_code != 0
+        result = shared_sync_simplebox.exec("sleep", "60", timeout=2)
+        assert result.exit_code != 0
 
-    def test_exec_combined_options(self, shared_sync_runtime):
+    def test_exec_combined_options(self, shared_sync_simplebox):
         """Per-exec cwd and user can be combined."""
-        with SyncSimpleBox(image="alpine:latest", runtime=shared_sync_runtime) as box:
-            result = box.exec(
-                "sh",
-                "-c",
-                "echo dir=$(pwd) user=$(whoami)",
-                cwd="/tmp",
-                user="nobody",
-            )
-            assert result.exit_code == 0
-            assert "dir=/tmp" in result.stdout
-            assert "user=nobody" in result.stdout
+        result = shared_sync_simplebox.exec(
+            "sh",
+            "-c",
+            "echo dir=$(pwd) user=$(whoami)",
+            cwd="/tmp",
+            user="nobody",
+        )
+        assert result.exit_code == 0
+        assert_contains(result.stdout, "dir=/tmp", "user=nobody")
 
 
 class TestSyncSimpleBoxConcurrentStreams:
@@ -98,6 +98,7 @@ class TestSyncSkillBoxSetup:
     """Test SyncSkillBox dependency installation."""
 
     @pytest.mark.slow
+    @pytest.mark.timeout(600)
     def test_setup_installs_dependencies(self, shared_sync_runtime, oauth_token):
         """Test that setup installs Claude CLI and required dependencies."""
         with SyncSkillBox(
@@ -123,6 +124,7 @@ class TestSyncSkillBoxInstallSkill:
     """Test sync skill installation functionality."""
 
     @pytest.mark.slow
+    @pytest.mark.timeout(600)
     def test_install_skill_returns_bool(self, shared_sync_runtime, oauth_token):
         """Test that install_skill returns a boolean."""
         with SyncSkillBox(
@@ -136,6 +138,7 @@ class TestSyncSkillBoxInstallSkill:
             assert isinstance(result, bool)
 
     @pytest.mark.slow
+    @pytest.mark.timeout(600)
     def test_install_invalid_skill_returns_false(
         self, shared_sync_runtime, oauth_token
     ):
@@ -160,6 +163,7 @@ class TestSyncSkillBoxCall:
     """
 
     @pytest.mark.slow
+    @pytest.mark.timeout(600)
     @pytest.mark.skip(reason="Requires valid OAuth token and Claude API access")
     def test_call_simple(self, shared_sync_runtime, oauth_token):
         """Test simple call to Claude."""
@@ -172,6 +176,7 @@ class TestSyncSkillBoxCall:
             assert len(result) > 0
 
     @pytest.mark.slow
+    @pytest.mark.timeout(600)
     @pytest.mark.skip(reason="Requires valid OAuth token and Claude API access")
     def test_call_multi_turn(self, shared_sync_runtime, oauth_token):
         """Test multi-turn conversation - Claude remembers context."""
@@ -21,7 +21,7 @@ if not hasattr(boxlite, "NetworkSpec"):
         allow_module_level=True,
     )
 
-pytestmark = [pytest.mark.integration, pytest.mark.asyncio]
+pytestmark = pytest.mark.integration
 
 ALLOWED_HOST = "example.com"
 SECONDARY_ALLOWED_HOST = "example.org"
@@ -55,7 +55,6 @@ class _FakeInfoBox:
         return self.info_value
 
 
-@pytest.mark.asyncio
 async def test_info_is_async():
     marker = object()
     box = SimpleBox.__new__(SimpleBox)
@@ -66,7 +65,6 @@ async def test_info_is_async():
     assert await box.info() is marker
 
 
-@pytest.mark.asyncio
 async def test_info_rejects_when_box_is_not_started():
     box = SimpleBox.__new__(SimpleBox)
     box._started = False
@@ -77,7 +75,6 @@ async def test_info_rejects_when_box_is_not_started():
         _ = await info
 
 
-@pytest.mark.asyncio
 async def test_endpoint_returns_local_file_descriptor():
     box = SimpleBox.__new__(SimpleBox)
     box._started = True
@@ -88,7 +85,6 @@ async def test_endpoint_returns_local_file_descriptor():
     assert box._box.network.ports == [3000]
 
 
-@pytest.mark.asyncio
 async def test_connect_consumes_tunnel_once():
     connection = _FakeConnection()
     box = SimpleBox.__new__(SimpleBox)
@@ -107,7 +103,6 @@ async def test_connect_consumes_tunnel_once():
         assert connection.closed
 
 
-@pytest.mark.asyncio
 async def test_tunnel_requires_a_started_box():
     box = SimpleBox.__new__(SimpleBox)
     box._started = False
@@ -41,7 +41,6 @@ def _write_nested_virtualization_archive(path) -> None:
             archive.addfile(entry, io.BytesIO(payload))
 
 
-@pytest.mark.asyncio
 async def test_untrusted_import_rejects_nested_virtualization(tmp_path) -> None:
     archive_path = tmp_path / "nested.boxlite"
     _write_nested_virtualization_archive(archive_path)